@@ -0,0 +1,148 @@
+"""
+Stand-ins and fixtures for the mawaqeet benchmarks.
+
+The benchmarks run without a live Home Assistant: coordinators are built
+on top of minimal stand-ins of the core objects they touch, the clock is
+frozen and scheduler timers are never armed.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from importlib.metadata import version
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.util.dt as dt_util
+import pytest
+from homeassistant.const import CONF_LATITUDE, CONF_LOCATION, CONF_LONGITUDE, CONF_NAME
+
+from custom_components.mawaqeet import scheduler
+from custom_components.mawaqeet.const import (
+    CALCULATION_METHOD,
+    FAJR_ANGLE,
+    HIGH_LATITUDE_RULE,
+    ISHAA_ANGLE,
+    MADHAB,
+)
+from custom_components.mawaqeet.coordinator import MawaqeetDataUpdateCoordinator
+from custom_components.mawaqeet.enum import (
+    CalculationMethod,
+    HighLatitudeRule,
+    Madhab,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+# Late winter, so that every latitude of the high latitude sweep has a
+# sunrise and a sunset over the whole window of the prayer time table
+FROZEN_NOW = datetime(2025, 2, 1, tzinfo=UTC)
+
+LATITUDE = 33.8938
+LONGITUDE = 35.5018
+
+
+def _noop() -> None:
+    """Stand in for the unsubscribe callback of a listener or a timer."""
+
+
+class StandInBus:
+    """Event bus that never delivers events."""
+
+    def async_listen(self, *_: Any, **__: Any) -> Callable[[], None]:
+        """Register nothing."""
+        return _noop
+
+    def async_listen_once(self, *_: Any, **__: Any) -> Callable[[], None]:
+        """Register nothing."""
+        return _noop
+
+
+class StandInHass:
+    """Minimal Home Assistant core for coordinators."""
+
+    def __init__(self, config_dir: Path) -> None:
+        """Initialize."""
+        self.data: dict[str, Any] = {}
+        self.bus = StandInBus()
+        self.config = SimpleNamespace(config_dir=str(config_dir))
+
+
+class StandInConfigEntry:
+    """Config entry holding data and options."""
+
+    def __init__(
+        self, entry_id: str, data: dict[str, Any], options: dict[str, Any]
+    ) -> None:
+        """Initialize."""
+        self.entry_id = entry_id
+        self.data = data
+        self.options = options
+
+    def async_on_unload(self, func: Callable[[], Any]) -> None:
+        """Ignore the unload callback, stand-in entries are never unloaded."""
+
+
+def build_config_entry(  # noqa: PLR0913
+    entry_id: str = "benchmark",
+    *,
+    latitude: float = LATITUDE,
+    longitude: float = LONGITUDE,
+    calculation_method: CalculationMethod = CalculationMethod.MUSLIM_WORLD_LEAGUE,
+    madhab: Madhab = Madhab.SHAFI,
+    high_latitude_rule: HighLatitudeRule = HighLatitudeRule.MIDDLE_OF_THE_NIGHT,
+) -> StandInConfigEntry:
+    """Build a config entry as created by the config flow."""
+    data = {
+        CONF_NAME: entry_id,
+        CONF_LOCATION: {CONF_LATITUDE: latitude, CONF_LONGITUDE: longitude},
+        CALCULATION_METHOD: str(calculation_method),
+    }
+    options = {
+        MADHAB: str(madhab),
+        HIGH_LATITUDE_RULE: str(high_latitude_rule),
+        # Only used by the custom calculation method
+        FAJR_ANGLE: 18.0,
+        ISHAA_ANGLE: 17.0,
+    }
+    return StandInConfigEntry(entry_id, data, options)
+
+
+type CoordinatorFactory = Callable[..., MawaqeetDataUpdateCoordinator]
+
+
+def pytest_benchmark_update_machine_info(machine_info: dict[str, Any]) -> None:
+    """Record the versions of the calculation libraries with the results."""
+    for package in ("adhanpy", "numpy", "homeassistant"):
+        machine_info[package] = version(package)
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Freeze the clock of the coordinator."""
+    monkeypatch.setattr(dt_util, "now", lambda *_: FROZEN_NOW)
+    return FROZEN_NOW
+
+
+@pytest.fixture(autouse=True)
+def _never_arm_timers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the scheduler from arming Home Assistant timers."""
+    monkeypatch.setattr(scheduler, "async_track_point_in_time", lambda *_, **__: _noop)
+
+
+@pytest.fixture
+def hass(tmp_path: Path) -> StandInHass:
+    """Return a stand-in Home Assistant core."""
+    return StandInHass(tmp_path)
+
+
+@pytest.fixture
+def coordinator_factory(hass: StandInHass) -> CoordinatorFactory:
+    """Return a factory of coordinators sharing the stand-in core."""
+
+    def factory(**kwargs: Any) -> MawaqeetDataUpdateCoordinator:
+        return MawaqeetDataUpdateCoordinator(hass, build_config_entry(**kwargs))
+
+    return factory
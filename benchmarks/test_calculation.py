@@ -0,0 +1,182 @@
+"""Benchmarks of the prayer time calculation."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from adhanpy.PrayerTimes import CalculationParameters, PrayerTimes
+
+from custom_components.mawaqeet.cache import async_get_cache
+from custom_components.mawaqeet.const import DEFAULT_WINDOW_DAYS
+from custom_components.mawaqeet.coordinator import compute_cached_days
+from custom_components.mawaqeet.enum import CalculationMethod, HighLatitudeRule
+from custom_components.mawaqeet.mapper import (
+    CalculationMethodMapper,
+    HighLatitudeRuleMapper,
+)
+from custom_components.mawaqeet.solar import SolarParameters
+
+from .conftest import (
+    FROZEN_NOW,
+    LATITUDE,
+    LONGITUDE,
+    CoordinatorFactory,
+    StandInHass,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from custom_components.mawaqeet.coordinator import MawaqeetDataUpdateCoordinator
+
+ROUNDS = 20
+
+HIGH_LATITUDES = range(55, 71, 3)
+
+
+def _cold_refresh(
+    benchmark: BenchmarkFixture,
+    hass: StandInHass,
+    coordinator_factory: CoordinatorFactory,
+    **kwargs: Any,
+) -> None:
+    """Benchmark the first refresh of a new entry with an empty cache."""
+
+    def setup() -> tuple[tuple[MawaqeetDataUpdateCoordinator], dict[str, Any]]:
+        async_get_cache(hass).clear()
+        return (coordinator_factory(**kwargs),), {}
+
+    benchmark.pedantic(
+        lambda coordinator: coordinator.get_new_prayer_times_info(),
+        setup=setup,
+        rounds=ROUNDS,
+    )
+
+
+@pytest.mark.parametrize("calculation_method", list(CalculationMethod))
+def test_cold_refresh_per_calculation_method(
+    benchmark: BenchmarkFixture,
+    hass: StandInHass,
+    coordinator_factory: CoordinatorFactory,
+    calculation_method: CalculationMethod,
+) -> None:
+    """Compute the prayer time table of each calculation method."""
+    _cold_refresh(
+        benchmark, hass, coordinator_factory, calculation_method=calculation_method
+    )
+
+
+@pytest.mark.parametrize("high_latitude_rule", list(HighLatitudeRule))
+def test_cold_refresh_per_high_latitude_rule(
+    benchmark: BenchmarkFixture,
+    hass: StandInHass,
+    coordinator_factory: CoordinatorFactory,
+    high_latitude_rule: HighLatitudeRule,
+) -> None:
+    """Compute the prayer time table of each high latitude rule."""
+    _cold_refresh(
+        benchmark, hass, coordinator_factory, high_latitude_rule=high_latitude_rule
+    )
+
+
+def test_warm_refresh(
+    benchmark: BenchmarkFixture, coordinator_factory: CoordinatorFactory
+) -> None:
+    """Refresh an entry whose prayer time table is already computed."""
+    coordinator = coordinator_factory()
+    coordinator.get_new_prayer_times_info()
+    benchmark(coordinator.get_new_prayer_times_info)
+
+
+@pytest.mark.parametrize("calculation_method", list(CalculationMethod))
+def test_calculation_method_mapper(
+    benchmark: BenchmarkFixture, calculation_method: CalculationMethod
+) -> None:
+    """Map each calculation method to adhanpy parameters."""
+    benchmark(CalculationMethodMapper.to_adhanpy, calculation_method)
+
+
+@pytest.mark.parametrize("high_latitude_rule", list(HighLatitudeRule))
+@pytest.mark.parametrize("latitude", HIGH_LATITUDES)
+def test_high_latitude_sweep(
+    benchmark: BenchmarkFixture,
+    hass: StandInHass,
+    coordinator_factory: CoordinatorFactory,
+    latitude: int,
+    high_latitude_rule: HighLatitudeRule,
+) -> None:
+    """Compute the prayer time table at high latitudes."""
+    _cold_refresh(
+        benchmark,
+        hass,
+        coordinator_factory,
+        latitude=float(latitude),
+        high_latitude_rule=high_latitude_rule,
+    )
+
+
+@pytest.mark.parametrize("high_latitude_rule", list(HighLatitudeRule))
+@pytest.mark.parametrize("latitude", HIGH_LATITUDES)
+def test_high_latitude_sweep_adhanpy(
+    benchmark: BenchmarkFixture,
+    frozen_now: datetime,
+    latitude: int,
+    high_latitude_rule: HighLatitudeRule,
+) -> None:
+    """Compute the same window day by day with adhanpy, as a reference."""
+    calculation_parameters = CalculationParameters(
+        **CalculationMethodMapper.to_adhanpy(CalculationMethod.MUSLIM_WORLD_LEAGUE)
+    )
+    calculation_parameters.high_latitude_rule = HighLatitudeRuleMapper.to_adhanpy(
+        high_latitude_rule
+    )
+    days = [
+        frozen_now.date() + timedelta(days=offset)
+        for offset in range(DEFAULT_WINDOW_DAYS)
+    ]
+
+    def compute() -> list[PrayerTimes]:
+        return [
+            PrayerTimes(
+                (float(latitude), LONGITUDE),
+                day,
+                calculation_parameters=calculation_parameters,
+            )
+            for day in days
+        ]
+
+    benchmark.pedantic(compute, rounds=ROUNDS)
+
+
+@pytest.mark.parametrize("batched", [False, True], ids=["per_site", "batched"])
+def test_cold_refresh_sites(
+    benchmark: BenchmarkFixture,
+    hass: StandInHass,
+    batched: bool,  # noqa: FBT001
+) -> None:
+    """Compute the prayer time tables of 60 sites, one by one or in one batch."""
+    cache = async_get_cache(hass)
+    locations = [(LATITUDE + index / 100, LONGITUDE) for index in range(60)]
+    solar_parameters = SolarParameters.from_calculation_parameters(
+        CalculationParameters(
+            **CalculationMethodMapper.to_adhanpy(CalculationMethod.MUSLIM_WORLD_LEAGUE)
+        )
+    )
+    first = FROZEN_NOW.date()
+
+    def refresh() -> None:
+        if batched:
+            compute_cached_days(
+                cache, locations, solar_parameters, first, DEFAULT_WINDOW_DAYS
+            )
+            return
+        for coordinates in locations:
+            compute_cached_days(
+                cache, [coordinates], solar_parameters, first, DEFAULT_WINDOW_DAYS
+            )
+
+    benchmark.pedantic(refresh, setup=cache.clear, rounds=ROUNDS)
@@ -0,0 +1,38 @@
+"""Tests of the prayer timetable export."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from custom_components.mawaqeet.enum import ExportFormat, PrayerTime
+from custom_components.mawaqeet.export import ICAL_LINE_OCTETS, export_timetable
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Long enough to be folded a few times, with multibyte characters
+LONG_NAME = "Masjid an-Nūr، مسجد النور الكبير في وسط المدينة القديمة " * 3
+
+
+def test_ical_lines_are_folded(tmp_path: Path) -> None:
+    """Fold long iCalendar lines without splitting UTF-8 sequences."""
+    day = date(2025, 2, 1)
+    prayer_times = {
+        prayer: datetime(2025, 2, 1, 4, tzinfo=UTC) + timedelta(hours=index * 2)
+        for index, prayer in enumerate(PrayerTime)
+    }
+    path = tmp_path / "timetable.ics"
+
+    export_timetable([(day, prayer_times)], path, ExportFormat.ICAL, LONG_NAME)
+
+    content = path.read_bytes()
+    lines = content.split(b"\r\n")
+    assert all(len(line) <= ICAL_LINE_OCTETS for line in lines)
+    # Every line is valid UTF-8 on its own
+    for line in lines:
+        line.decode()
+
+    unfolded = content.decode().replace("\r\n ", "")
+    assert f"X-WR-CALNAME:{LONG_NAME.replace(',', '\\,')}\r\n" in unfolded
+    assert unfolded.count("BEGIN:VEVENT") == len(PrayerTime)
@@ -0,0 +1,128 @@
+"""Parity of the solar engine with adhanpy."""
+
+from __future__ import annotations
+
+import math
+import random
+from datetime import date, timedelta
+
+import pytest
+from adhanpy.PrayerTimes import CalculationParameters, PrayerTimes
+
+from custom_components.mawaqeet.cache import PrayerTimeCache
+from custom_components.mawaqeet.coordinator import compute_cached_days
+from custom_components.mawaqeet.enum import (
+    CalculationMethod,
+    HighLatitudeRule,
+    Madhab,
+)
+from custom_components.mawaqeet.mapper import (
+    CalculationMethodMapper,
+    HighLatitudeRuleMapper,
+    MadhabMapper,
+)
+from custom_components.mawaqeet.solar import SolarParameters, compute_prayer_times
+from custom_components.mawaqeet.timetable import ROW_SIZE
+
+from .conftest import LONGITUDE
+
+# From the equator to the polar circles, both hemispheres
+LATITUDES = (-54.0, -33.9, 0.0, 21.4, 33.8938, 51.5, 59.9, 64.1, 69.6)
+
+# Every other week of a year, with both solstices
+DAYS = [date(2025, 1, 1) + timedelta(days=offset) for offset in range(0, 365, 14)]
+DAYS += [date(2025, 6, 21), date(2025, 12, 21)]
+
+PRAYERS = ("fajr", "sunrise", "dhuhr", "asr", "maghrib", "isha")
+
+# Locations with more decimals than anyone would round to
+RANDOM_LOCATIONS = 100
+RANDOM_DAYS = 90
+
+
+def _adhanpy_times(
+    coordinates: tuple[float, float],
+    day: date,
+    calculation_parameters: CalculationParameters,
+) -> tuple[float, ...]:
+    """Return the prayer times of adhanpy in seconds since the epoch, or NaN."""
+    try:
+        prayer_times = PrayerTimes(
+            coordinates, day, calculation_parameters=calculation_parameters
+        )
+    except (RuntimeError, TypeError, ValueError):
+        # Days adhanpy cannot compute
+        return (math.nan,) * len(PRAYERS)
+    return tuple(getattr(prayer_times, prayer).timestamp() for prayer in PRAYERS)
+
+
+@pytest.mark.parametrize("high_latitude_rule", list(HighLatitudeRule))
+@pytest.mark.parametrize("madhab", list(Madhab))
+@pytest.mark.parametrize(
+    "calculation_method",
+    [method for method in CalculationMethod if method != CalculationMethod.CUSTOM],
+)
+def test_parity_with_adhanpy(
+    calculation_method: CalculationMethod,
+    madhab: Madhab,
+    high_latitude_rule: HighLatitudeRule,
+) -> None:
+    """Compute the same prayer times as adhanpy, undefined days included."""
+    calculation_parameters = CalculationParameters(
+        **CalculationMethodMapper.to_adhanpy(calculation_method)
+    )
+    calculation_parameters.madhab = MadhabMapper.to_adhanpy(madhab)
+    calculation_parameters.high_latitude_rule = HighLatitudeRuleMapper.to_adhanpy(
+        high_latitude_rule
+    )
+    solar_parameters = SolarParameters.from_calculation_parameters(
+        calculation_parameters
+    )
+
+    for latitude in LATITUDES:
+        solar_times = compute_prayer_times(
+            latitude,
+            LONGITUDE,
+            [day.toordinal() for day in DAYS],
+            solar_parameters,
+        )
+        for index, day in enumerate(DAYS):
+            expected = _adhanpy_times(
+                (latitude, LONGITUDE), day, calculation_parameters
+            )
+            actual = tuple(
+                float(getattr(solar_times, prayer)[index]) for prayer in PRAYERS
+            )
+            assert actual == pytest.approx(expected, abs=0, nan_ok=True), (
+                latitude,
+                day,
+            )
+
+
+def test_cached_days_parity_with_adhanpy() -> None:
+    """Compute the days of exact coordinates through the cache, like adhanpy."""
+    calculation_parameters = CalculationParameters(
+        **CalculationMethodMapper.to_adhanpy(CalculationMethod.MUSLIM_WORLD_LEAGUE)
+    )
+    solar_parameters = SolarParameters.from_calculation_parameters(
+        calculation_parameters
+    )
+    generator = random.Random(0)  # noqa: S311
+    locations = [
+        (generator.uniform(-55, 55), generator.uniform(-180, 180))
+        for _ in range(RANDOM_LOCATIONS)
+    ]
+    first = DAYS[0]
+
+    values = compute_cached_days(
+        PrayerTimeCache(), locations, solar_parameters, first, RANDOM_DAYS
+    )
+    for coordinates, location_values in zip(locations, values, strict=True):
+        for offset in range(0, len(location_values), ROW_SIZE):
+            day = first + timedelta(days=offset // ROW_SIZE)
+            expected = _adhanpy_times(coordinates, day, calculation_parameters)
+            actual = tuple(location_values[offset : offset + len(PRAYERS)])
+            assert actual == pytest.approx(expected, abs=0, nan_ok=True), (
+                coordinates,
+                day,
+            )
@@ -0,0 +1,97 @@
+"""Benchmarks of the prayer event scheduling."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.mawaqeet.const import DEFAULT_WINDOW_DAYS
+from custom_components.mawaqeet.timetable import PrayerTimeIndex
+
+from .conftest import FROZEN_NOW, LATITUDE, LONGITUDE, CoordinatorFactory
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+@pytest.mark.parametrize("entries", [1, 10, 100])
+def test_schedule_entries(
+    benchmark: BenchmarkFixture,
+    coordinator_factory: CoordinatorFactory,
+    entries: int,
+) -> None:
+    """Schedule, then cancel, the prayer events of every config entry."""
+    coordinators = [
+        coordinator_factory(
+            entry_id=f"entry_{index}",
+            latitude=LATITUDE + index / 10,
+            longitude=LONGITUDE,
+        )
+        for index in range(entries)
+    ]
+    schedules = [
+        (coordinator, coordinator.get_new_prayer_times_info())
+        for coordinator in coordinators
+    ]
+
+    def schedule() -> None:
+        for coordinator, mawaqeet_data in schedules:
+            coordinator.async_schedule_future_update(mawaqeet_data)
+        for coordinator in coordinators:
+            coordinator.clear_event_sub()
+
+    benchmark(schedule)
+
+
+@pytest.mark.parametrize("entries", [1, 10, 100])
+def test_reschedule_entries(
+    benchmark: BenchmarkFixture,
+    coordinator_factory: CoordinatorFactory,
+    entries: int,
+) -> None:
+    """Schedule again the prayer events of every config entry, as a refresh."""
+    coordinators = [
+        coordinator_factory(
+            entry_id=f"entry_{index}",
+            latitude=LATITUDE + index / 10,
+            longitude=LONGITUDE,
+        )
+        for index in range(entries)
+    ]
+    schedules = [
+        (coordinator, coordinator.get_new_prayer_times_info())
+        for coordinator in coordinators
+    ]
+    for coordinator, mawaqeet_data in schedules:
+        coordinator.async_schedule_future_update(mawaqeet_data)
+
+    def reschedule() -> None:
+        for coordinator, mawaqeet_data in schedules:
+            coordinator.async_schedule_future_update(mawaqeet_data)
+
+    benchmark(reschedule)
+
+
+def test_prayer_lookup(
+    benchmark: BenchmarkFixture,
+    coordinator_factory: CoordinatorFactory,
+) -> None:
+    """Find the current and next prayer every hour of the window of an entry."""
+    coordinator = coordinator_factory()
+    first = FROZEN_NOW.date()
+    days = coordinator.iter_day_times(
+        first, first + timedelta(days=DEFAULT_WINDOW_DAYS - 1)
+    )
+    index = PrayerTimeIndex(day_times for _, day_times in days if day_times)
+    instants = [
+        FROZEN_NOW + timedelta(hours=hours) for hours in range(DEFAULT_WINDOW_DAYS * 24)
+    ]
+
+    def lookup() -> None:
+        for now in instants:
+            index.current(now)
+            index.next(now)
+
+    benchmark(lookup)
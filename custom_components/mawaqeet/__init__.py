@@ -9,33 +9,58 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import homeassistant.helpers.config_validation as cv
 from homeassistant.const import Platform
 
-from .const import DOMAIN
-from .coordinator import MawaqeetDataUpdateCoordinator
+from .const import CONF_SITES, DOMAIN
+from .coordinator import (
+    MawaqeetDataUpdateCoordinator,
+    get_hijri_calendar,
+    get_site_unique_id,
+    get_timetable_store,
+)
+from .hijri import async_load_calendar
+from .services import async_setup_services
+from .site_group import MawaqeetSiteGroupCoordinator
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
     Platform.EVENT,
     Platform.BUTTON,
+    Platform.CALENDAR,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, _: ConfigType) -> bool:
+    """Set up the services of the integration."""
+    async_setup_services(hass)
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
-    coordinator = MawaqeetDataUpdateCoordinator(hass=hass, config_entry=entry)
+    coordinator: MawaqeetDataUpdateCoordinator | MawaqeetSiteGroupCoordinator
+    if CONF_SITES in entry.data:
+        coordinator = MawaqeetSiteGroupCoordinator(hass=hass, config_entry=entry)
+    else:
+        coordinator = MawaqeetDataUpdateCoordinator(hass=hass, config_entry=entry)
+    await coordinator.async_load()
+    await async_load_calendar(hass, get_hijri_calendar(entry))
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
@@ -43,21 +68,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        coordinator: MawaqeetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+        coordinator: MawaqeetDataUpdateCoordinator | MawaqeetSiteGroupCoordinator = (
+            hass.data[DOMAIN][entry.entry_id]
+        )
         coordinator.clear_event_sub()
+        await coordinator.async_flush()
         hass.data[DOMAIN].pop(entry.entry_id)
     return unloaded
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored prayer time tables of a removed entry."""
+    if CONF_SITES not in entry.data:
+        await get_timetable_store(hass, entry.entry_id).async_remove()
+        return
+
+    for site in entry.data[CONF_SITES]:
+        unique_id = get_site_unique_id(entry.entry_id, site)
+        await get_timetable_store(hass, unique_id).async_remove()
 
 
-async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Triggered by config entry options updates."""
-    coordinator: MawaqeetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    coordinator.clear_event_sub()
-    await hass.config_entries.async_reload(entry.entry_id)
-    await coordinator.async_request_refresh()
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply updated options in place, without reloading the platforms."""
+    coordinator: MawaqeetDataUpdateCoordinator | MawaqeetSiteGroupCoordinator = (
+        hass.data[DOMAIN][entry.entry_id]
+    )
+    await async_load_calendar(hass, get_hijri_calendar(entry))
+    await coordinator.async_reconfigure()
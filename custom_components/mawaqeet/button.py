@@ -9,17 +9,14 @@ from homeassistant.components.button import (
     ButtonEntity,
     ButtonEntityDescription,
 )
-from homeassistant.const import CONF_DEVICE_ID, CONF_TYPE
 
 from .const import (
-    DOMAIN,
-    MAWAQEET_EVENT,
-    PRAYER,
     PRAYER_REMINDER_TRIGGER,
     PRAYER_TIME_TRIGGER,
 )
 from .entity import MawaqeetEntity
 from .enum import PrayerTime
+from .site_group import get_entry_coordinators
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -95,12 +92,12 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_devices: AddEntitiesCallback
 ) -> None:
     """Set up the button platform."""
-    coordinator: MawaqeetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_devices(
         MawaqeetButton(
             coordinator=coordinator,
             entity_description=entity_description,
         )
+        for coordinator in get_entry_coordinators(hass, entry)
         for entity_description in ENTITY_DESCRIPTIONS
     )
 
@@ -121,13 +118,6 @@ class MawaqeetButton(MawaqeetEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Button press."""
-        device_id = self.coordinator.device.device_id
-        trigger_type = self.entity_description.trigger_type
-        prayer = self.entity_description.prayer
-
-        event_data = {
-            CONF_DEVICE_ID: device_id,
-            CONF_TYPE: trigger_type,
-            PRAYER: prayer,
-        }
-        self.hass.bus.async_fire(MAWAQEET_EVENT, event_data)
+        self.coordinator.async_fire_prayer_event(
+            self.entity_description.trigger_type, str(self.entity_description.prayer)
+        )
@@ -0,0 +1,87 @@
+"""Prayer time cache shared by mawaqeet config entries."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CACHE, DEFAULT_CACHE_SIZE, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+type CacheKey = tuple[tuple[float, float], Hashable, int]
+type CacheRow = tuple[float, ...]
+
+
+class PrayerTimeCache:
+    """
+    Least recently used cache of computed days.
+
+    Keys are the exact coordinates, the hashable resolved calculation
+    parameters and the day ordinal, nearby locations are not shared as their
+    prayer times can differ by a minute. The cache is filled from executor
+    threads, so every access holds a lock.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize."""
+        self._maxsize = maxsize
+        self._rows: OrderedDict[CacheKey, CacheRow] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached days."""
+        return len(self._rows)
+
+    @property
+    def maxsize(self) -> int:
+        """Return the maximum number of cached days."""
+        return self._maxsize
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the ratio of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: CacheKey) -> CacheRow | None:
+        """Return a cached day and mark it as recently used."""
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._rows.move_to_end(key)
+            return row
+
+    def put(self, key: CacheKey, row: CacheRow) -> None:
+        """Cache a day, evicting the least recently used ones when full."""
+        with self._lock:
+            self._rows[key] = row
+            self._rows.move_to_end(key)
+            while len(self._rows) > self._maxsize:
+                self._rows.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached day and reset the counters."""
+        with self._lock:
+            self._rows.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+@callback
+def async_get_cache(hass: HomeAssistant) -> PrayerTimeCache:
+    """Return the prayer time cache of the integration."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (cache := domain_data.get(CACHE)) is None:
+        cache = domain_data[CACHE] = PrayerTimeCache()
+    return cache
@@ -0,0 +1,126 @@
+"""Calendar platform for mawaqeet."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+import homeassistant.util.dt as dt_util
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+
+from .entity import MawaqeetEntity
+from .enum import PrayerTime
+from .site_group import get_entry_coordinators
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import MawaqeetDataUpdateCoordinator
+
+PRAYER_TIMES = "prayer_times"
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_devices: AddEntitiesCallback
+) -> None:
+    """Set up the calendar platform."""
+    async_add_devices(
+        MawaqeetCalendar(coordinator=coordinator)
+        for coordinator in get_entry_coordinators(hass, entry)
+    )
+
+
+class MawaqeetCalendar(MawaqeetEntity, CalendarEntity):
+    """
+    Mawaqeet Calendar class.
+
+    Every prayer time is an event lasting until the next one, the last third
+    of the night lasting until the Fajr of the next day. Events are only
+    computed for the days that are requested, through the prayer time cache.
+
+    The current event is looked up in the prayer time index of the
+    coordinator, so writing the state computes nothing.
+    """
+
+    _attr_translation_key = PRAYER_TIMES
+
+    def __init__(self, coordinator: MawaqeetDataUpdateCoordinator) -> None:
+        """Initialize the calendar class."""
+        super().__init__(coordinator, PRAYER_TIMES)
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current prayer time, lasting until the next one."""
+        now = dt_util.utcnow()
+        if (
+            self.coordinator.data is None
+            or (current := self.coordinator.get_current_prayer(now)) is None
+            or (following := self.coordinator.get_next_prayer(now)) is None
+        ):
+            return None
+
+        prayer, start = current
+        # Night times of yesterday overlap the beginning of today
+        prayer_times = self.coordinator.data.prayer_times
+        day = prayer_times.day
+        if start < prayer_times[prayer]:
+            day -= timedelta(days=1)
+        elif start > prayer_times[prayer]:
+            day += timedelta(days=1)
+
+        return self.__get_event(day, prayer, start, following[1])
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Return prayer times between a start and end date."""
+        events = await hass.async_add_executor_job(
+            self.__get_events,
+            dt_util.as_local(start_date).date() - timedelta(days=1),
+            dt_util.as_local(end_date).date(),
+        )
+        return [
+            event
+            for event in events
+            if event.end > start_date and event.start < end_date
+        ]
+
+    def __get_event(
+        self, day: date, prayer: PrayerTime, start: datetime, end: datetime
+    ) -> CalendarEvent:
+        return CalendarEvent(
+            start=start,
+            end=end,
+            summary=prayer.label,
+            uid=f"{self.coordinator.unique_id}_{day.isoformat()}_{prayer}",
+        )
+
+    def __get_events(self, first: date, last: date) -> list[CalendarEvent]:
+        events: list[CalendarEvent] = []
+
+        # The next day is needed for the end of the last third of the night
+        days = self.coordinator.iter_prayer_times(first, last + timedelta(days=1))
+        for (day, prayer_times), (_, next_prayer_times) in pairwise(days):
+            if prayer_times is None:
+                continue
+
+            ends = list(prayer_times.values())[1:]
+            if next_prayer_times is not None:
+                ends.append(next_prayer_times[PrayerTime.FAJR])
+
+            events.extend(
+                self.__get_event(day, prayer, start, end)
+                for (prayer, start), end in zip(
+                    prayer_times.items(), ends, strict=False
+                )
+                # Events need a positive duration
+                if end > start
+            )
+
+        return events
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
+from homeassistant.components.file_upload import process_uploaded_file
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
@@ -13,6 +15,8 @@ from homeassistant.config_entries import (
 from homeassistant.const import CONF_LATITUDE, CONF_LOCATION, CONF_LONGITUDE, CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.selector import (
+    FileSelector,
+    FileSelectorConfig,
     LocationSelector,
     LocationSelectorConfig,
     NumberSelector,
@@ -22,37 +26,60 @@ from homeassistant.helpers.selector import (
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
+    TextSelector,
+    TextSelectorConfig,
 )
 
 from .const import (
     CALCULATION_METHOD,
+    CONF_SITES,
+    CONF_SITES_FILE,
     DOMAIN,
     FAJR_ANGLE,
     HIGH_LATITUDE_RULE,
+    HIJRI_CALENDAR,
     ISHAA_ANGLE,
     ISHAA_INTERVAL,
     MADHAB,
+    PROCESS_WORKERS,
 )
-from .enum import CalculationMethod, HighLatitudeRule, Madhab, PrayerAdjustment
+from .enum import (
+    CalculationMethod,
+    HighLatitudeRule,
+    HijriCalendar,
+    Madhab,
+    PrayerAdjustment,
+    PrayerTimeReminder,
+)
+from .site_group import parse_sites
 
 if TYPE_CHECKING:
     from homeassistant.data_entry_flow import FlowResult
 
+CALCULATION_METHOD_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=[
+            SelectOptionDict(value=str(m), label=str(m)) for m in CalculationMethod
+        ],
+        mode=SelectSelectorMode.DROPDOWN,
+        multiple=False,
+        translation_key=CALCULATION_METHOD,
+    )
+)
+
 DATA_SCHEMA = {
     vol.Required(CONF_NAME): str,
     # vol.Required(CONF_LATITUDE): cv.latitude,
     # vol.Required(CONF_LONGITUDE): cv.longitude,
     vol.Required(CONF_LOCATION): LocationSelector(LocationSelectorConfig()),
-    vol.Required(CALCULATION_METHOD): SelectSelector(
-        SelectSelectorConfig(
-            options=[
-                SelectOptionDict(value=str(m), label=str(m)) for m in CalculationMethod
-            ],
-            mode=SelectSelectorMode.DROPDOWN,
-            multiple=False,
-            translation_key=CALCULATION_METHOD,
-        )
-    ),
+    vol.Required(CALCULATION_METHOD): CALCULATION_METHOD_SELECTOR,
+}
+
+SITE_GROUP_SCHEMA = {
+    vol.Required(CONF_NAME): str,
+    vol.Optional(CONF_SITES): TextSelector(TextSelectorConfig(multiline=True)),
+    vol.Optional(CONF_SITES_FILE): FileSelector(FileSelectorConfig(accept=".csv")),
+    vol.Required(CALCULATION_METHOD): CALCULATION_METHOD_SELECTOR,
 }
 
 CALCULATION_SCHEMA = {
@@ -106,6 +133,40 @@ ADJUSTMENT_SCHEMA = {
     ),
 }
 
+REMINDER_SCHEMA = {
+    vol.Optional(str(reminder), 0): NumberSelector(
+        NumberSelectorConfig(
+            min=0,
+            max=120,
+            mode=NumberSelectorMode.BOX,
+            step=1,
+            unit_of_measurement="min",
+        )
+    )
+    for reminder in PrayerTimeReminder
+}
+
+HIJRI_SCHEMA = {
+    vol.Optional(HIJRI_CALENDAR, default=str(HijriCalendar.TABULAR)): SelectSelector(
+        SelectSelectorConfig(
+            options=[
+                SelectOptionDict(value=str(c), label=str(c)) for c in HijriCalendar
+            ],
+            mode=SelectSelectorMode.DROPDOWN,
+            multiple=False,
+            translation_key=HIJRI_CALENDAR,
+        )
+    ),
+}
+
+PROCESS_SCHEMA = {
+    vol.Optional(PROCESS_WORKERS, 0): NumberSelector(
+        NumberSelectorConfig(
+            min=0, max=os.cpu_count() or 1, mode=NumberSelectorMode.BOX, step=1
+        )
+    ),
+}
+
 
 def _get_data_schema(
     hass: HomeAssistant, config_entry: ConfigEntry | None = None
@@ -138,6 +199,12 @@ def configured_instances(hass: HomeAssistant) -> set[str]:
     return set(entries)
 
 
+def _read_uploaded_file(hass: HomeAssistant, file_id: str) -> str:
+    """Return the content of an uploaded file, removing it."""
+    with process_uploaded_file(hass, file_id) as path:
+        return path.read_text(encoding="utf-8-sig")
+
+
 class MawaqeetFlowHandler(ConfigFlow, domain=DOMAIN):
     """Config flow for Mawaqeet."""
 
@@ -145,9 +212,18 @@ class MawaqeetFlowHandler(ConfigFlow, domain=DOMAIN):
 
     async def async_step_user(
         self,
-        user_input: dict | None = None,
+        user_input: dict | None = None,  # noqa: ARG002
     ) -> FlowResult:
         """Handle a flow initialized by the user."""
+        return self.async_show_menu(
+            step_id="user", menu_options=["location", "site_group"]
+        )
+
+    async def async_step_location(
+        self,
+        user_input: dict | None = None,
+    ) -> FlowResult:
+        """Step of a single location."""
         _errors = {}
 
         if user_input is not None:
@@ -167,7 +243,56 @@ class MawaqeetFlowHandler(ConfigFlow, domain=DOMAIN):
         )
 
         return self.async_show_form(
-            step_id="user", data_schema=data_schema, errors=_errors, last_step=False
+            step_id="location",
+            data_schema=data_schema,
+            errors=_errors,
+            last_step=False,
+        )
+
+    async def async_step_site_group(
+        self,
+        user_input: dict | None = None,
+    ) -> FlowResult:
+        """Step of a group of sites sharing their calculation settings."""
+        _errors = {}
+        placeholders = {"error": ""}
+
+        if user_input is not None:
+            text = user_input.get(CONF_SITES, "")
+            try:
+                # The uploaded file is removed once read
+                if file_id := user_input.pop(CONF_SITES_FILE, None):
+                    content = await self.hass.async_add_executor_job(
+                        _read_uploaded_file, self.hass, file_id
+                    )
+                    # A header line of the file stays first
+                    text = content + "\n" + text
+                sites = parse_sites(text)
+            except ValueError as err:
+                _errors["base"] = "invalid_sites"
+                placeholders["error"] = str(err)
+            else:
+                self.user_data = {
+                    CONF_NAME: user_input[CONF_NAME],
+                    CONF_SITES: sites,
+                    CALCULATION_METHOD: user_input[CALCULATION_METHOD],
+                }
+                return await self.async_step_adjustment()
+
+        data_schema = self.add_suggested_values_to_schema(
+            vol.Schema(SITE_GROUP_SCHEMA),
+            {
+                CALCULATION_METHOD: str(CalculationMethod.MUSLIM_WORLD_LEAGUE),
+                **(user_input or {}),
+            },
+        )
+
+        return self.async_show_form(
+            step_id="site_group",
+            data_schema=data_schema,
+            errors=_errors,
+            description_placeholders=placeholders,
+            last_step=False,
         )
 
     async def async_step_adjustment(self, user_input: dict | None = None) -> FlowResult:
@@ -184,6 +309,9 @@ class MawaqeetFlowHandler(ConfigFlow, domain=DOMAIN):
             data_schema = data_schema.extend(CALCULATION_SCHEMA)
 
         data_schema = data_schema.extend(ADJUSTMENT_SCHEMA)
+        data_schema = data_schema.extend(REMINDER_SCHEMA)
+        data_schema = data_schema.extend(HIJRI_SCHEMA)
+        data_schema = data_schema.extend(PROCESS_SCHEMA)
 
         suggested_values = {
             FAJR_ANGLE: 18,
@@ -232,6 +360,9 @@ class OptionsFlowHandler(OptionsFlow):
             data_schema = data_schema.extend(CALCULATION_SCHEMA)
 
         data_schema = data_schema.extend(ADJUSTMENT_SCHEMA)
+        data_schema = data_schema.extend(REMINDER_SCHEMA)
+        data_schema = data_schema.extend(HIJRI_SCHEMA)
+        data_schema = data_schema.extend(PROCESS_SCHEMA)
         options = self._config_entry.options
         data_schema = self.add_suggested_values_to_schema(data_schema, options)
 
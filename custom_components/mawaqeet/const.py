@@ -12,6 +12,11 @@ ATTRIBUTION = ""
 MAWAQEET_EVENT = "mawaqeet_event"
 PRAYER_TIME_TRIGGER = "prayer_time"
 PRAYER_REMINDER_TRIGGER = "prayer_reminder"
+REFRESH_TRIGGER = "refresh"
+
+SCHEDULER = "scheduler"
+CACHE = "cache"
+PROCESS_POOL = "process_pool"
 
 PRAYER = "prayer"
 FAJR = "fajr"
@@ -28,3 +33,29 @@ FAJR_ANGLE = "fajr_angle"
 ISHAA_ANGLE = "ishaa_angle"
 ISHAA_INTERVAL = "ishaa_interval"
 HIGH_LATITUDE_RULE = "high_latitude_rule"
+
+CONF_SITES = "sites"
+CONF_SITES_FILE = "sites_file"
+PROCESS_WORKERS = "process_workers"
+HIJRI_CALENDAR = "hijri_calendar"
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+DEFAULT_WINDOW_DAYS = 30
+DEFAULT_CACHE_SIZE = 4096
+DIAGNOSTICS_SAMPLES = 20
+TIMETABLE_CHUNK_DAYS = 31
+# Smaller batches, such as a cold refresh of the window of an entry, compute
+# faster than the round trip to a worker process
+PROCESS_POOL_MIN_DAYS = 32
+
+SERVICE_EXPORT_TIMETABLE = "export_timetable"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_FORMAT = "format"
+EXPORT_DIR = "www"
+EXPORT_MAX_DAYS = 3660
+SERVICE_GET_TIMES = "get_times"
+GET_TIMES_MAX_DAYS = 366
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from itertools import groupby, pairwise
 from typing import TYPE_CHECKING, Any, TypedDict
 
 import homeassistant.util.dt as dt_util
+import numpy as np
 from adhanpy.calculation.PrayerAdjustments import (
     PrayerAdjustments as AdhanPrayerAdjustments,
 )
-from adhanpy.PrayerTimes import CalculationParameters, PrayerTimes
+from adhanpy.PrayerTimes import CalculationParameters
 from homeassistant.const import (
     CONF_LATITUDE,
     CONF_LOCATION,
@@ -17,32 +23,47 @@ from homeassistant.const import (
 )
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
-from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
+from homeassistant.util import slugify
 
+from .cache import CacheKey, PrayerTimeCache, async_get_cache
 from .const import (
     CALCULATION_METHOD,
+    DEFAULT_WINDOW_DAYS,
     DOMAIN,
     FAJR_ANGLE,
     HIGH_LATITUDE_RULE,
+    HIJRI_CALENDAR,
     ISHAA_ANGLE,
     ISHAA_INTERVAL,
     LOGGER,
     MADHAB,
     MAWAQEET_EVENT,
+    PRAYER_REMINDER_TRIGGER,
     PRAYER_TIME_TRIGGER,
+    PROCESS_POOL_MIN_DAYS,
+    PROCESS_WORKERS,
+    REFRESH_TRIGGER,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TIMETABLE_CHUNK_DAYS,
 )
 from .device_info import MawaqeetDeviceInfo
 from .enum import (
     CalculationMethod,
     HighLatitudeRule,
+    HijriCalendar,
     Madhab,
     PrayerAdjustment,
     PrayerTime,
     PrayerTimeOption,
+    PrayerTimeReminder,
 )
+from .instrumentation import Timings, timed
 from .mapper import (
     CalculationMethodMapper,
     HighLatitudeRuleMapper,
@@ -50,32 +71,181 @@ from .mapper import (
     PrayerAdjustmentMapper,
     PrayerAdjustments,
 )
+from .process_pool import MawaqeetProcessPool, async_get_process_pool
+from .scheduler import EventSpec, MawaqeetScheduler, async_get_scheduler
+from .solar import SolarParameters, compute_prayer_times
+from .timetable import (
+    ROW_SIZE,
+    DayRow,
+    DayTimes,
+    PrayerTimeIndex,
+    PrayerTimeTable,
+    StoredTable,
+    to_day_row,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from homeassistant.config_entries import ConfigEntry
 
 type NightTimes = tuple[timedelta, datetime, datetime]
 type PrayerTimeEntries = dict[PrayerTime, datetime]
 type PrayerTimeConfig = dict[PrayerTimeOption, Any]
 type Coordinates = tuple[float, float]
-
-
-class MawaqeetData(TypedDict):
-    """Mawaqeet Data."""
-
-    prayer_times: PrayerTimeEntries
-    prayer_times_config: PrayerTimeConfig
+type LocationParameters = tuple[Coordinates, CalculationParameters, SolarParameters]
+# First day, number of days and `ROW_SIZE` values per day
+type ComputedDays = tuple[date, int, Sequence[float]]
+
+REMINDER_PRAYERS: dict[PrayerTimeReminder, PrayerTime] = {
+    PrayerTimeReminder.FAJR_REMINDER: PrayerTime.FAJR,
+    PrayerTimeReminder.SHURUQ_REMINDER: PrayerTime.SHURUQ,
+    PrayerTimeReminder.DHUHR_REMINDER: PrayerTime.DHUHR,
+    PrayerTimeReminder.ASR_REMINDER: PrayerTime.ASR,
+    PrayerTimeReminder.MAGHRIB_REMINDER: PrayerTime.MAGHRIB,
+    PrayerTimeReminder.ISHAA_REMINDER: PrayerTime.ISHAA,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class MawaqeetData:
+    """
+    Mawaqeet Data of a day.
+
+    Only holds what changes every day, the prayer time config only changes
+    with the options and is kept by the coordinator.
+    """
+
+    prayer_times: DayTimes
+    # Of today and tomorrow, a long lead time reaches back before the refresh
+    prayer_reminders: tuple[tuple[PrayerTime, datetime], ...]
+    night_length: float  # From Maghrib to Shuruq, in milliseconds
+    night_duration: int  # From Maghrib to Fajr, in seconds
+
+    def get_option(self, option: PrayerTimeOption) -> float | None:
+        """Return the value of a prayer time option that changes daily."""
+        if option == PrayerTimeOption.NIGHT_LENGTH:
+            return self.night_length
+        if option == PrayerTimeOption.NIGHT_DURATION:
+            return self.night_duration
+        return None
+
+
+class MawaqeetSite(TypedDict):
+    """Named location of a site group entry."""
+
+    name: str
+    latitude: float
+    longitude: float
+
+
+class StoredTimetable(StoredTable):
+    """Prayer time table of a config entry as stored on disk."""
+
+    fingerprint: str
+
+
+def get_timetable_store(hass: HomeAssistant, unique_id: str) -> Store[StoredTimetable]:
+    """Return the store of the prayer time table of a config entry or site."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{unique_id}")
+
+
+def get_hijri_calendar(config_entry: ConfigEntry) -> HijriCalendar:
+    """Return the Hijri calendar of a config entry."""
+    return HijriCalendar(
+        config_entry.options.get(HIJRI_CALENDAR, HijriCalendar.TABULAR)
+    )
+
+
+def get_site_unique_id(entry_id: str, site: MawaqeetSite) -> str:
+    """Return the unique id of a site of a site group entry."""
+    return f"{entry_id}_{slugify(site['name'])}"
+
+
+def compute_cached_days(  # noqa: PLR0913
+    cache: PrayerTimeCache | None,
+    locations: Sequence[Coordinates],
+    solar_parameters: SolarParameters,
+    first: date,
+    days: int,
+    pool: MawaqeetProcessPool | None = None,
+) -> list[list[float]]:
+    """
+    Return `ROW_SIZE` values per day of each location.
+
+    Days are looked up in the cache first, the missing days of every
+    location are then computed together in a single call to the engine,
+    in a worker process of `pool` when they are numerous enough. Without
+    a cache, every day is computed.
+    """
+    keys: list[CacheKey] = [
+        (coordinates, solar_parameters, ordinal)
+        for coordinates in locations
+        for ordinal in range(first.toordinal(), first.toordinal() + days)
+    ]
+    rows = [cache.get(key) if cache is not None else None for key in keys]
+
+    if missing := [index for index, row in enumerate(rows) if row is None]:
+        arguments = (
+            [keys[index][0][0] for index in missing],
+            [keys[index][0][1] for index in missing],
+            [keys[index][2] for index in missing],
+            solar_parameters,
+        )
+        prayer_times = None
+        if pool is not None and len(missing) >= PROCESS_POOL_MIN_DAYS:
+            prayer_times = pool.compute(*arguments)
+        if prayer_times is None:
+            prayer_times = compute_prayer_times(*arguments)
+        for index, row in zip(
+            missing, np.column_stack(prayer_times).tolist(), strict=True
+        ):
+            rows[index] = tuple(row)
+            if cache is not None:
+                cache.put(keys[index], rows[index])
+
+    if cache is not None:
+        LOGGER.debug(
+            "Computed %s of %s day(s), cache hits: %s, misses: %s",
+            len(missing),
+            len(keys),
+            cache.hits,
+            cache.misses,
+        )
+    return [
+        [value for row in rows[offset : offset + days] if row for value in row]
+        for offset in range(0, len(rows), days or 1)
+    ]
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
 class MawaqeetDataUpdateCoordinator(DataUpdateCoordinator[MawaqeetData]):
     """Class to manage fetching data from the API."""
 
-    _event_unsubs: list[CALLBACK_TYPE]
+    _scheduler: MawaqeetScheduler
     _device: MawaqeetDeviceInfo
-
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-        """Initialize."""
+    _table: PrayerTimeTable
+    _cache: PrayerTimeCache
+    _pool: MawaqeetProcessPool
+    _timings: Timings
+    _store: Store[StoredTimetable]
+    _unsaved: StoredTimetable | None
+    _parameters: LocationParameters | None
+    _config: PrayerTimeConfig | None
+    _published_config: PrayerTimeConfig
+    _changed_keys: frozenset[str]
+    _index: PrayerTimeIndex
+    _window: dict[date, DayTimes | None]
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        window_days: int = DEFAULT_WINDOW_DAYS,
+        *,
+        site: MawaqeetSite | None = None,
+    ) -> None:
+        """Initialize, for a single location or a site of a site group entry."""
         super().__init__(
             hass=hass,
             logger=LOGGER,
@@ -83,16 +253,159 @@ class MawaqeetDataUpdateCoordinator(DataUpdateCoordinator[MawaqeetData]):
         )
 
         self.config_entry = config_entry
+        self._site = site
+        self._unique_id = (
+            config_entry.entry_id
+            if site is None
+            else get_site_unique_id(config_entry.entry_id, site)
+        )
         self._device = MawaqeetDeviceInfo(
-            hass, self.config_entry, DeviceEntryType.SERVICE
+            hass,
+            self.config_entry,
+            DeviceEntryType.SERVICE,
+            unique_id=self._unique_id,
+            name=site["name"] if site else None,
         )
-        self._event_unsubs = []
+        config_entry.async_on_unload(self._device.async_track_registry_updates())
+        self._scheduler = async_get_scheduler(hass)
+        # One more day for the night of yesterday, that extends into today
+        self._table = PrayerTimeTable(window_days + 1)
+        self._cache = async_get_cache(hass)
+        self._pool = async_get_process_pool(hass)
+        self._release_workers: CALLBACK_TYPE | None = None
+        self.__async_request_workers()
+        config_entry.async_on_unload(self.__async_release_workers)
+        self._timings = Timings()
+        self._store = get_timetable_store(hass, self._unique_id)
+        self._unsaved = None
+        self._parameters = None
+        self._table_fingerprint = self.fingerprint
+        self._config = None
+        self._published_config = {}
+        self._changed_keys = frozenset()
+        self._index = PrayerTimeIndex()
+        self._window = {}
+
+    @property
+    def unique_id(self) -> str:
+        """Unique id of the config entry, or of the site of a site group entry."""
+        return self._unique_id
+
+    @property
+    def site(self) -> MawaqeetSite | None:
+        """Site of a site group entry, None for a single location."""
+        return self._site
 
     @property
     def device(self) -> MawaqeetDeviceInfo:
         """Mawaqeet Device Info."""
         return self._device
 
+    @property
+    def timings(self) -> Timings:
+        """Recent timings of computations, scheduling and prayer events."""
+        return self._timings
+
+    @property
+    def changed_keys(self) -> frozenset[str]:
+        """Keys whose value changed with the latest refresh."""
+        return self._changed_keys
+
+    def get_current_prayer(self, now: datetime) -> tuple[PrayerTime, datetime] | None:
+        """Return the prayer time whose period `now` is in, if it is known."""
+        return self._index.current(now)
+
+    def get_next_prayer(self, now: datetime) -> tuple[PrayerTime, datetime] | None:
+        """Return the first prayer time after `now`, if any is left."""
+        return self._index.next(now)
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the settings the prayer time table depends on."""
+        return self.__get_fingerprint(self.__get_parameters())
+
+    def __get_fingerprint(self, parameters: LocationParameters) -> str:
+        # Only what the solar engine computes from, other options like the
+        # reminders do not change the prayer times
+        coordinates, _, solar_parameters = parameters
+        settings = {
+            "coordinates": coordinates,
+            "solar_parameters": asdict(solar_parameters),
+            "window_days": self._table.days,
+        }
+        return hashlib.sha256(
+            json.dumps(settings, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    async def async_load(self) -> None:
+        """Load the stored prayer time table if it matches the settings."""
+        if (stored := await self._store.async_load()) is None:
+            return
+
+        if stored["fingerprint"] != self.fingerprint:
+            LOGGER.debug("Ignoring stored prayer time table of outdated settings")
+            return
+
+        self._table.load(stored["start"], stored["rows"])
+
+    @callback
+    def __async_request_workers(self) -> None:
+        self.__async_release_workers()
+        if workers := self.config_entry.options.get(PROCESS_WORKERS, 0):
+            self._release_workers = self._pool.async_request_workers(
+                self._unique_id, int(workers)
+            )
+
+    @callback
+    def __async_release_workers(self) -> None:
+        if self._release_workers is not None:
+            self._release_workers()
+            self._release_workers = None
+
+    @callback
+    def async_apply_options(self) -> None:
+        """
+        Apply changed options.
+
+        The table of outdated settings is only dropped by the next refresh,
+        as a refresh in flight may still be filling it.
+        """
+        self.__async_request_workers()
+        self._parameters = None
+        self._config = None
+        self._window = {}
+
+    async def async_reconfigure(self) -> None:
+        """
+        Apply changed options in place.
+
+        The refresh recomputes the prayer times and reschedules the prayer
+        events, the entities only receive the new data. It is requested like
+        every other refresh, so that it never overlaps one.
+        """
+        self.async_apply_options()
+        await self.async_request_refresh()
+
+    @callback
+    def _async_save(self) -> None:
+        stored: StoredTimetable = {
+            "fingerprint": self._table_fingerprint,
+            **self._table.as_dict(),
+        }
+        self._unsaved = stored
+        self._store.async_delay_save(lambda: stored, STORAGE_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """
+        Write a delayed save of the prayer time table now.
+
+        Called on unload, so that a delayed save never writes the table back
+        after the entry is removed.
+        """
+        if (stored := self._unsaved) is not None:
+            self._unsaved = None
+            await self._store.async_save(stored)
+
     def __get_adjustments(self) -> AdhanPrayerAdjustments:
         if self.config_entry is None:
             return AdhanPrayerAdjustments()
@@ -155,11 +468,14 @@ class MawaqeetDataUpdateCoordinator(DataUpdateCoordinator[MawaqeetData]):
         return calculation_parameters
 
     def __get_mawaqeet_parameters(self) -> tuple[Coordinates, CalculationParameters]:
-        location: dict[str, float] = self.config_entry.data.get(CONF_LOCATION, {})
-        latitude: float = location.get(CONF_LATITUDE, 0.0)
-        longitude: float = location.get(CONF_LONGITUDE, 0.0)
+        if self._site is not None:
+            coordinates = (self._site["latitude"], self._site["longitude"])
+        else:
+            location: dict[str, float] = self.config_entry.data.get(CONF_LOCATION, {})
+            latitude: float = location.get(CONF_LATITUDE, 0.0)
+            longitude: float = location.get(CONF_LONGITUDE, 0.0)
 
-        coordinates = (latitude, longitude)
+            coordinates = (latitude, longitude)
 
         adjustments = self.__get_adjustments()
         calculation_parameters = self.__get_calculation_parameters()
@@ -168,9 +484,30 @@ class MawaqeetDataUpdateCoordinator(DataUpdateCoordinator[MawaqeetData]):
 
         return coordinates, calculation_parameters
 
-    def __get_night_times(
-        self, today: PrayerTimes, tomorrow: PrayerTimes
-    ) -> NightTimes:
+    def __get_reminder_lead_times(self) -> dict[PrayerTime, timedelta]:
+        options = self.config_entry.options
+        lead_times: dict[PrayerTime, timedelta] = {}
+
+        for reminder, prayer in REMINDER_PRAYERS.items():
+            minutes: float = options.get(str(reminder), 0)
+            if minutes > 0:
+                lead_times[prayer] = timedelta(minutes=minutes)
+
+        return lead_times
+
+    def __get_reminders(
+        self, day_times: DayTimes, tomorrow: DayRow
+    ) -> tuple[tuple[PrayerTime, datetime], ...]:
+        lead_times = self.__get_reminder_lead_times()
+        # Rows start with the prayers of the reminders, in the same order
+        tomorrow_times = dict(zip(REMINDER_PRAYERS.values(), tomorrow, strict=False))
+        return tuple(
+            (prayer, prayer_times[prayer] - lead_time)
+            for prayer_times in (day_times, tomorrow_times)
+            for prayer, lead_time in lead_times.items()
+        )
+
+    def __get_night_times(self, today: DayRow, tomorrow: DayRow) -> NightTimes:
         night_duration = tomorrow.fajr - today.maghrib
         half_of_night = night_duration.seconds / 2
         third_of_night = night_duration.seconds / 3
@@ -180,36 +517,67 @@ class MawaqeetDataUpdateCoordinator(DataUpdateCoordinator[MawaqeetData]):
 
         return night_duration, midnight, last_third
 
-    def get_new_prayer_times_info(self) -> MawaqeetData:
-        """Fetch prayer times for today."""
-        coordinates, calculation_parameters = self.__get_mawaqeet_parameters()
-
-        today = dt_util.now()
-        tomorrow = today + timedelta(days=1)
-
-        today_prayer = PrayerTimes(
-            coordinates, today, calculation_parameters=calculation_parameters
-        )
-        tomorrow_prayer = PrayerTimes(
-            coordinates, tomorrow, calculation_parameters=calculation_parameters
+    def __get_day_times(
+        self, day: date, today: DayRow, tomorrow: DayRow
+    ) -> tuple[DayTimes, timedelta]:
+        night_duration, midnight, last_third = self.__get_night_times(today, tomorrow)
+
+        day_times = DayTimes(
+            day=day,
+            fajr=today.fajr,
+            shuruq=today.sunrise,
+            dhuhr=today.dhuhr,
+            asr=today.asr,
+            maghrib=today.maghrib,
+            ishaa=today.isha,
+            midnight=midnight,
+            last_third=last_third,
         )
+        return day_times, night_duration
+
+    def __compute_days(  # noqa: PLR0913
+        self,
+        coordinates: Coordinates,
+        solar_parameters: SolarParameters,
+        first: date,
+        days: int,
+        *,
+        use_cache: bool = True,
+    ) -> Sequence[float]:
+        return compute_cached_days(
+            self._cache if use_cache else None,
+            [coordinates],
+            solar_parameters,
+            first,
+            days,
+            self._pool,
+        )[0]
+
+    def __get_parameters(self) -> LocationParameters:
+        # Built once per options change, not on every computation
+        if (parameters := self._parameters) is None:
+            coordinates, calc_params = self.__get_mawaqeet_parameters()
+            parameters = self._parameters = (
+                coordinates,
+                calc_params,
+                SolarParameters.from_calculation_parameters(calc_params),
+            )
+        return parameters
 
-        night_duration, midnight, last_third = self.__get_night_times(
-            today_prayer, tomorrow_prayer
-        )
+    @property
+    def hijri_calendar(self) -> HijriCalendar:
+        """Calendar of the Hijri date."""
+        return get_hijri_calendar(self.config_entry)
 
-        prayer_times: PrayerTimeEntries = {
-            PrayerTime.FAJR: today_prayer.fajr,
-            PrayerTime.SHURUQ: today_prayer.sunrise,
-            PrayerTime.DHUHR: today_prayer.dhuhr,
-            PrayerTime.ASR: today_prayer.asr,
-            PrayerTime.MAGHRIB: today_prayer.maghrib,
-            PrayerTime.ISHAA: today_prayer.isha,
-            PrayerTime.MIDNIGHT: midnight,
-            PrayerTime.LAST_THIRD: last_third,
-        }
+    @property
+    def prayer_times_config(self) -> PrayerTimeConfig:
+        """Prayer time options that only change with the options of the entry."""
+        if (config := self._config) is None:
+            config = self._config = self.__get_prayer_times_config()
+        return config
 
-        calc_params = today_prayer.calculation_parameters
+    def __get_prayer_times_config(self) -> PrayerTimeConfig:
+        _, calc_params, _ = self.__get_parameters()
 
         calc_method = self.config_entry.data.get(CALCULATION_METHOD)
         madhab = MadhabMapper.to_mawaqeet(calc_params.madhab)
@@ -217,11 +585,9 @@ class MawaqeetDataUpdateCoordinator(DataUpdateCoordinator[MawaqeetData]):
             calc_params.high_latitude_rule
         )
 
-        prayer_times_config: PrayerTimeConfig = {
+        return {
             PrayerTimeOption.CALCULATION_METHOD: str(calc_method),
             PrayerTimeOption.MADHAB: str(madhab),
-            PrayerTimeOption.NIGHT_LENGTH: today_prayer.night_length,
-            PrayerTimeOption.NIGHT_DURATION: night_duration.seconds,
             PrayerTimeOption.HIGH_LATITUDE_RULE: str(high_latitude_rule),
             PrayerTimeOption.FAJR_ANGLE: calc_params.fajr_angle,
             PrayerTimeOption.ISHAA_ANGLE: calc_params.isha_angle,
@@ -234,60 +600,349 @@ class MawaqeetDataUpdateCoordinator(DataUpdateCoordinator[MawaqeetData]):
             PrayerTimeOption.ISHAA_OFFSET: calc_params.adjustments.isha,
         }
 
-        return {
-            "prayer_times": prayer_times,
-            "prayer_times_config": prayer_times_config,
-        }
+    def get_location_parameters(self) -> tuple[Coordinates, SolarParameters]:
+        """Return the coordinates and solar parameters of the prayer times."""
+        coordinates, _, solar_parameters = self.__get_parameters()
+        return coordinates, solar_parameters
+
+    def missing_days(self, today: date) -> tuple[date, int]:
+        """Return the first day and number of days a refresh would compute."""
+        start = today - timedelta(days=1)
+        if self.fingerprint != self._table_fingerprint:
+            # The whole table is computed again for the new settings
+            return start, self._table.days
+        missing = self._table.missing_days(start)
+        return start + timedelta(days=self._table.days - missing), missing
+
+    def get_new_prayer_times_info(
+        self, computed_days: ComputedDays | None = None
+    ) -> MawaqeetData:
+        """
+        Fetch prayer times for today.
+
+        `computed_days` are the missing days already computed by a site group,
+        they are used as they are if they are still the missing ones.
+        """
+        with timed(
+            self._timings.compute, "Computed prayer times of %s", self._unique_id
+        ):
+            return self.__get_new_prayer_times_info(computed_days)
+
+    def __get_new_prayer_times_info(
+        self, computed_days: ComputedDays | None
+    ) -> MawaqeetData:
+        parameters = self.__get_parameters()
+        coordinates, _, solar_parameters = parameters
+        if (
+            fingerprint := self.__get_fingerprint(parameters)
+        ) != self._table_fingerprint:
+            LOGGER.debug("Dropping prayer time table of outdated settings")
+            self._table.clear()
+            self._table_fingerprint = fingerprint
+
+        today = dt_util.now().date()
+        tomorrow = today + timedelta(days=1)
+
+        def compute(first: date, days: int) -> Sequence[float]:
+            if computed_days is not None and computed_days[:2] == (first, days):
+                return computed_days[2]
+            return self.__compute_days(coordinates, solar_parameters, first, days)
+
+        computed = self._table.advance(today - timedelta(days=1), compute)
+        LOGGER.debug("Advanced prayer time table by %s day(s)", computed)
+
+        today_prayer = self._table.row(today)
+        tomorrow_prayer = self._table.row(tomorrow)
+
+        day_times, night_duration = self.__get_day_times(
+            today, today_prayer, tomorrow_prayer
+        )
+
+        return MawaqeetData(
+            prayer_times=day_times,
+            prayer_reminders=self.__get_reminders(day_times, tomorrow_prayer),
+            night_length=today_prayer.night_length,
+            night_duration=night_duration.seconds,
+        )
+
+    def iter_day_times(
+        self, start: date, end: date, *, use_cache: bool = True
+    ) -> Iterator[tuple[date, DayTimes | None]]:
+        """
+        Generate the prayer times of every day from `start` to `end`.
+
+        Days are computed a chunk at a time, outside of the prayer time table,
+        through the prayer time cache unless `use_cache` is False, so that
+        long ranges do not evict the days of the entries. Days whose prayer
+        times are undefined at the location are None.
+        """
+        coordinates, _, solar_parameters = self.__get_parameters()
+
+        last = end.toordinal()
+        for first in range(start.toordinal(), last + 1, TIMETABLE_CHUNK_DAYS):
+            days = min(TIMETABLE_CHUNK_DAYS, last + 1 - first)
+            # One more day for the night times of the last day of the chunk
+            values = self.__compute_days(
+                coordinates,
+                solar_parameters,
+                date.fromordinal(first),
+                days + 1,
+                use_cache=use_cache,
+            )
+            rows = [
+                to_day_row(values[offset : offset + ROW_SIZE])
+                for offset in range(0, len(values), ROW_SIZE)
+            ]
+            for offset, (today, tomorrow) in enumerate(pairwise(rows)):
+                day = date.fromordinal(first + offset)
+                if today is None or tomorrow is None:
+                    yield day, None
+                else:
+                    yield day, self.__get_day_times(day, today, tomorrow)[0]
+
+    def iter_prayer_times(
+        self, start: date, end: date, *, use_cache: bool = True
+    ) -> Iterator[tuple[date, PrayerTimeEntries | None]]:
+        """Generate the prayer times of every day from `start` to `end`."""
+        for day, day_times in self.iter_day_times(start, end, use_cache=use_cache):
+            yield day, dict(day_times.items()) if day_times else None
+
+    def get_prayer_times(self, start: date, end: date | None = None) -> list[DayTimes]:
+        """
+        Return the prayer times of a day, or of every day from `start` to `end`.
+
+        Days whose prayer times are undefined at the location are left out.
+        """
+        return [
+            day_times
+            for _, day_times in self.iter_day_times(start, end or start)
+            if day_times is not None
+        ]
+
+    async def async_get_prayer_times(
+        self, start: date, end: date | None = None
+    ) -> list[DayTimes]:
+        """
+        Return the prayer times of a day or a date range, see `get_prayer_times`.
+
+        Days of the window of the coordinator are served as they are, only the
+        other days are computed in the executor.
+        """
+        days = [
+            date.fromordinal(ordinal)
+            for ordinal in range(start.toordinal(), (end or start).toordinal() + 1)
+        ]
+        window = self._window
+        missing = [day for day in days if day not in window]
+        # Missing days come before and/or after the window, a job for each run
+        runs = [
+            [day for _, day in run]
+            for _, run in groupby(
+                enumerate(missing), key=lambda item: item[1].toordinal() - item[0]
+            )
+        ]
+        computed = await asyncio.gather(
+            *(
+                self.hass.async_add_executor_job(self.get_prayer_times, run[0], run[-1])
+                for run in runs
+            )
+        )
+
+        day_times = {day: window.get(day) for day in days}
+        day_times.update(
+            (computed_day_times.day, computed_day_times)
+            for run_day_times in computed
+            for computed_day_times in run_day_times
+        )
+        # In the order of the days, computed days were already keys
+        return [times for times in day_times.values() if times is not None]
 
     @callback
-    def async_schedule_future_update(self, prayer_times: PrayerTimeEntries) -> None:
-        """Schedule future update for sensors."""
-        utc_now = dt_util.now()
-
-        for prayer, prayer_dt in prayer_times.items():
-            if prayer_dt > utc_now:
-                event_unsub = async_track_point_in_time(
-                    self.hass,
-                    self._async_fire_prayer_event(PRAYER_TIME_TRIGGER, str(prayer)),
+    def async_schedule_future_update(self, mawaqeet_data: MawaqeetData) -> None:
+        """
+        Schedule future update for sensors.
+
+        Replaces the events scheduled by the previous refresh: events still
+        due are kept, superseded ones are cancelled, so that refreshing
+        never fires an event twice.
+        """
+        with timed(
+            self._timings.schedule, "Scheduled prayer events of %s", self._unique_id
+        ):
+            utc_now = dt_util.now()
+            prayer_times = mawaqeet_data.prayer_times
+
+            specs: list[EventSpec] = [
+                (
                     prayer_dt,
+                    trigger_type,
+                    str(prayer),
+                    self._async_fire_prayer_event(trigger_type, str(prayer)),
+                )
+                for trigger_type, entries in (
+                    (PRAYER_TIME_TRIGGER, prayer_times.items()),
+                    (PRAYER_REMINDER_TRIGGER, mawaqeet_data.prayer_reminders),
+                )
+                for prayer, prayer_dt in entries
+                if prayer_dt > utc_now
+            ]
+
+            next_update_at = prayer_times[PrayerTime.LAST_THIRD]
+            if next_update_at <= utc_now:
+                # The night ends before midnight, refreshing at its last third
+                # would compute the same day again
+                next_update_at = dt_util.start_of_local_day(
+                    utc_now.date() + timedelta(days=1)
                 )
-                self._event_unsubs.append(event_unsub)
+            specs.append(
+                (
+                    next_update_at,
+                    REFRESH_TRIGGER,
+                    str(PrayerTime.LAST_THIRD),
+                    self.async_request_update,
+                )
+            )
+
+            self._scheduler.async_reschedule(self._unique_id, specs)
 
-        next_update_at = prayer_times[PrayerTime.LAST_THIRD]
-        event_unsub = async_track_point_in_time(
-            self.hass, self.async_request_update, next_update_at
+    @property
+    def scheduled_events(self) -> int:
+        """Number of pending prayer events and refreshes."""
+        return self._scheduler.pending(self._unique_id)
+
+    @property
+    def next_refresh(self) -> datetime | None:
+        """Time of the next scheduled refresh."""
+        return next(
+            (
+                event.when
+                for event in self._scheduler.events(self._unique_id)
+                if event.trigger == REFRESH_TRIGGER
+            ),
+            None,
         )
-        self._event_unsubs.append(event_unsub)
 
     async def async_request_update(self, _: datetime) -> None:
         """Request update from coordinator."""
         await self.async_request_refresh()
 
-    def _async_fire_prayer_event(self, trigger_type: str, prayer: str) -> Any:
-        event_data = {
-            "device_id": self._device.device_id,
-            "type": trigger_type,
-            "prayer": prayer,
-        }
+    def prayer_event_signal(self, trigger_type: str) -> str:
+        """Dispatcher signal of the prayer events of a trigger type."""
+        return f"{DOMAIN}_{self._unique_id}_{trigger_type}"
 
-        async def fire_event(dt: datetime) -> None:
+    @callback
+    def async_fire_prayer_event(
+        self, trigger_type: str, prayer: str, time_fired: datetime | None = None
+    ) -> None:
+        """Dispatch a prayer event to the entities and fire it on the bus."""
+        with timed(
+            self._timings.fire,
+            "Fired %s of %s for %s",
+            trigger_type,
+            prayer,
+            self._unique_id,
+        ):
+            # The device is registered after the first refresh, so its id
+            # is only resolved once the event is due
+            event_data = {
+                "device_id": self._device.device_id,
+                "type": trigger_type,
+                "prayer": prayer,
+            }
             self.hass.bus.async_fire(
-                MAWAQEET_EVENT, event_data, time_fired=dt.timestamp()
+                MAWAQEET_EVENT,
+                event_data,
+                time_fired=time_fired.timestamp() if time_fired else None,
             )
+            async_dispatcher_send(
+                self.hass, self.prayer_event_signal(trigger_type), prayer
+            )
+
+    def _async_fire_prayer_event(self, trigger_type: str, prayer: str) -> Any:
+        @callback
+        def fire_event(dt: datetime) -> None:
+            self.async_fire_prayer_event(trigger_type, prayer, dt)
 
         return fire_event
 
     async def _async_update_data(self) -> MawaqeetData:
         """Update data via library."""
-        mawaqeet_data = await self.hass.async_add_executor_job(
-            self.get_new_prayer_times_info
-        )
+        if self.missing_days(dt_util.now().date())[1] == 0:
+            # Every day is already computed, no need for the executor
+            mawaqeet_data = self.get_new_prayer_times_info()
+        else:
+            mawaqeet_data = await self.hass.async_add_executor_job(
+                self._timings.queued(self.get_new_prayer_times_info)
+            )
+            self._async_save()
 
-        self.async_schedule_future_update(mawaqeet_data["prayer_times"])
+        self._async_process_data(mawaqeet_data)
         return mawaqeet_data
 
+    @callback
+    def async_set_computed_data(
+        self, mawaqeet_data: MawaqeetData, *, save: bool
+    ) -> None:
+        """Set data computed outside of the coordinator, by its site group."""
+        if save:
+            self._async_save()
+        self._async_process_data(mawaqeet_data)
+        self.async_set_updated_data(mawaqeet_data)
+
+    @callback
+    def _async_process_data(self, mawaqeet_data: MawaqeetData) -> None:
+        config = self.prayer_times_config
+        self._changed_keys = self.__get_changed_keys(self.data, mawaqeet_data) | {
+            key
+            for key, value in config.items()
+            if self._published_config.get(key) != value
+        }
+        self._published_config = config
+        # Built on the event loop once the table is filled, the table itself
+        # is only ever read and written by the refresh job
+        self._window = self.__get_window()
+        self._index = PrayerTimeIndex(
+            day_times for day_times in self._window.values() if day_times is not None
+        )
+        self.async_schedule_future_update(mawaqeet_data)
+
+    def __get_window(self) -> dict[date, DayTimes | None]:
+        rows = list(self._table.iter_rows())
+        return {
+            day: self.__get_day_times(day, today, tomorrow)[0]
+            if today is not None and tomorrow is not None
+            else None
+            for (day, today), (_, tomorrow) in pairwise(rows)
+        }
+
+    @staticmethod
+    def __get_changed_keys(
+        old_data: MawaqeetData | None, new_data: MawaqeetData
+    ) -> frozenset[str]:
+        if old_data is None:
+            return frozenset(
+                (
+                    *PrayerTime,
+                    PrayerTimeOption.NIGHT_LENGTH,
+                    PrayerTimeOption.NIGHT_DURATION,
+                )
+            )
+
+        changed_keys: set[str] = {
+            prayer
+            for prayer, prayer_dt in new_data.prayer_times.items()
+            if old_data.prayer_times[prayer] != prayer_dt
+        }
+        changed_keys.update(
+            option
+            for option in (
+                PrayerTimeOption.NIGHT_LENGTH,
+                PrayerTimeOption.NIGHT_DURATION,
+            )
+            if old_data.get_option(option) != new_data.get_option(option)
+        )
+        return frozenset(changed_keys)
+
     def clear_event_sub(self) -> None:
         """Clean Event Subscription."""
-        for event_unsub in self._event_unsubs:
-            event_unsub()
-        self._event_unsubs.clear()
+        self._scheduler.async_cancel(self._unique_id)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 
@@ -12,49 +13,88 @@ from .const import DOMAIN, NAME, VERSION
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
 
 
 class MawaqeetDeviceInfo:
     """Mawaqeet Device Info."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         hass: HomeAssistant,
         config_entry: ConfigEntry | None = None,
         device_type: DeviceEntryType | None = None,
+        *,
+        unique_id: str | None = None,
+        name: str | None = None,
     ) -> None:
-        """Initialize the DeviceInfo."""
+        """
+        Initialize the DeviceInfo.
+
+        `unique_id` and `name` default to the ones of the config entry, they
+        are set for the sites of a site group entry.
+        """
         self._hass = hass
         self._config_entry = config_entry
         self._device_type = device_type
+        self._unique_id = unique_id
+        self._name = name
+        self._device_info = self.__build_device_info()
+        self._device_id: str | None = None
 
     @property
     def available(self) -> bool:
         """Return device availability."""
         return True
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device specific attributes."""
+    def __build_device_info(self) -> DeviceInfo:
         if self._config_entry is None:
             return DeviceInfo()
 
         return DeviceInfo(
-            identifiers={(DOMAIN, self._config_entry.entry_id)},
-            name=self._config_entry.data[CONF_NAME],
+            identifiers={(DOMAIN, self._unique_id or self._config_entry.entry_id)},
+            name=self._name or self._config_entry.data[CONF_NAME],
             model=VERSION,
             manufacturer=NAME,
             entry_type=self._device_type,
         )
 
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device specific attributes."""
+        return self._device_info
+
     @property
     def device_id(self) -> str | None:
-        """Get device id."""
-        device_info = self.device_info
-        device_registry = dr.async_get(self._hass)
-        if device_entry := device_registry.async_get_device(
-            identifiers=device_info.get("identifiers")
-        ):
-            return device_entry.id
-        return None
+        """
+        Get device id.
+
+        The registry is only queried until the device is found, the id is
+        then cached until the device registry reports a change to it.
+        """
+        if self._device_id is None:
+            device_registry = dr.async_get(self._hass)
+            if device_entry := device_registry.async_get_device(
+                identifiers=self._device_info.get("identifiers")
+            ):
+                self._device_id = device_entry.id
+        return self._device_id
+
+    @callback
+    def async_track_registry_updates(self) -> CALLBACK_TYPE:
+        """Invalidate the cached device id when its registry entry changes."""
+
+        @callback
+        def filter_event(event_data: dr.EventDeviceRegistryUpdatedData) -> bool:
+            return (
+                self._device_id is not None
+                and event_data["device_id"] == self._device_id
+            )
+
+        @callback
+        def invalidate(_: Event[dr.EventDeviceRegistryUpdatedData]) -> None:
+            self._device_id = None
+
+        return self._hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, invalidate, event_filter=filter_event
+        )
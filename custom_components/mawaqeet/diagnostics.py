@@ -0,0 +1,85 @@
+"""Diagnostics support for mawaqeet."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_LATITUDE, CONF_LOCATION, CONF_LONGITUDE
+
+from .cache import async_get_cache
+from .const import CONF_SITES, DOMAIN
+from .process_pool import async_get_process_pool
+from .scheduler import async_get_scheduler
+from .site_group import MawaqeetSiteGroupCoordinator
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import MawaqeetDataUpdateCoordinator
+    from .scheduler import MawaqeetScheduler
+
+TO_REDACT = {CONF_LOCATION, CONF_LATITUDE, CONF_LONGITUDE, CONF_SITES}
+
+
+def _coordinator_diagnostics(
+    coordinator: MawaqeetDataUpdateCoordinator, scheduler: MawaqeetScheduler
+) -> dict[str, Any]:
+    next_refresh = coordinator.next_refresh
+    return {
+        "last_update_success": coordinator.last_update_success,
+        "next_refresh": next_refresh.isoformat() if next_refresh else None,
+        "timings": coordinator.timings.as_dict(),
+        "scheduled_events": [
+            {
+                "when": event.when.isoformat(),
+                "trigger": event.trigger,
+                "prayer": event.prayer,
+            }
+            for event in scheduler.events(coordinator.unique_id)
+        ],
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: MawaqeetDataUpdateCoordinator | MawaqeetSiteGroupCoordinator = (
+        hass.data[DOMAIN][entry.entry_id]
+    )
+    cache = async_get_cache(hass)
+    scheduler = async_get_scheduler(hass)
+
+    diagnostics: dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "cache": {
+            "size": len(cache),
+            "maxsize": cache.maxsize,
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "hit_rate": round(cache.hit_rate, 4),
+        },
+        "scheduler": {
+            "pending_events": len(scheduler),
+            "timers": scheduler.timers,
+        },
+        "process_pool": {
+            "workers": async_get_process_pool(hass).workers,
+        },
+    }
+
+    if isinstance(coordinator, MawaqeetSiteGroupCoordinator):
+        diagnostics["timings"] = coordinator.timings.as_dict()
+        diagnostics["sites"] = {
+            unique_id: _coordinator_diagnostics(site, scheduler)
+            for unique_id, site in coordinator.sites.items()
+        }
+    else:
+        diagnostics.update(_coordinator_diagnostics(coordinator, scheduler))
+
+    return diagnostics
@@ -19,5 +19,5 @@ class MawaqeetEntity(CoordinatorEntity[MawaqeetDataUpdateCoordinator]):
     ) -> None:
         """Initialize."""
         super().__init__(coordinator)
-        self._attr_unique_id = coordinator.config_entry.entry_id + "_" + entity_name
+        self._attr_unique_id = coordinator.unique_id + "_" + entity_name
         self._attr_device_info = coordinator.device.device_info
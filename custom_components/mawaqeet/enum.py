@@ -15,6 +15,11 @@ class PrayerTime(StrEnum):
     MIDNIGHT = auto()
     LAST_THIRD = auto()
 
+    @property
+    def label(self) -> str:
+        """Return the name of the prayer time in title case."""
+        return self.replace("_", " ").title()
+
 
 class PrayerTimeOption(StrEnum):
     """Prayer Time Options."""
@@ -46,6 +51,13 @@ class PrayerTimeReminder(StrEnum):
     ISHAA_REMINDER = auto()
 
 
+class HijriCalendar(StrEnum):
+    """Hijri Calendars."""
+
+    TABULAR = auto()
+    UMM_AL_QURA = auto()
+
+
 class CalculationMethod(StrEnum):
     """Calculation Methods."""
 
@@ -87,3 +99,11 @@ class HighLatitudeRule(StrEnum):
     MIDDLE_OF_THE_NIGHT = auto()
     SEVENTH_OF_THE_NIGHT = auto()
     TWILIGHT_ANGLE = auto()
+
+
+class ExportFormat(StrEnum):
+    """Timetable Export Formats."""
+
+    CSV = auto()
+    JSON = auto()
+    ICAL = auto()
@@ -3,25 +3,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal, TypedDict
+from typing import TYPE_CHECKING, Literal
 
 from homeassistant.components.event import (
     EventEntity,
     EventEntityDescription,
 )
-from homeassistant.const import CONF_DEVICE_ID, CONF_TYPE
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import (
-    DOMAIN,
-    LOGGER,
-    MAWAQEET_EVENT,
-    PRAYER,
     PRAYER_REMINDER_TRIGGER,
     PRAYER_TIME_TRIGGER,
 )
 from .entity import MawaqeetEntity
 from .enum import PrayerTime
+from .site_group import get_entry_coordinators
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -35,14 +32,6 @@ LATEST_PRAYER_REMINDER = "latest_prayer_reminder"
 PRAYER_TIMES = [str(prayer_time) for prayer_time in PrayerTime]
 
 
-class MawaqeetEventData(TypedDict):
-    """Mawaqeet Event Data."""
-
-    device_id: str
-    type: str
-    prayer: str
-
-
 type TRIGGER_TYPE = Literal["prayer_time", "prayer_reminder"] | None
 
 
@@ -75,12 +64,12 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_devices: AddEntitiesCallback
 ) -> None:
     """Set up the event platform."""
-    coordinator: MawaqeetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_devices(
         MawaqeetEvent(
             coordinator=coordinator,
             entity_description=entity_description,
         )
+        for coordinator in get_entry_coordinators(hass, entry)
         for entity_description in ENTITY_DESCRIPTIONS
     )
 
@@ -98,34 +87,32 @@ class MawaqeetEvent(MawaqeetEntity, EventEntity):
         """Initialize the event class."""
         super().__init__(coordinator, entity_description.key)
         self.entity_description = entity_description
+        self._last_available = False
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
-
-        @callback
-        def filter_event(event_data: MawaqeetEventData) -> bool:
-            LOGGER.debug(
-                "trigger_type: %s, device_id: %s, event_type: %s, bool result: %s",
-                self.entity_description.trigger_type,
-                event_data[CONF_DEVICE_ID],
-                event_data[CONF_TYPE],
-                event_data[CONF_DEVICE_ID] == self.coordinator.device.device_id
-                and event_data[CONF_TYPE] == self.entity_description.trigger_type,
+        await super().async_added_to_hass()
+        self._last_available = self.available
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.coordinator.prayer_event_signal(
+                    self.entity_description.trigger_type
+                ),
+                self._async_handle_event,
             )
-            return (
-                event_data[CONF_DEVICE_ID] == self.coordinator.device.device_id
-                and event_data[CONF_TYPE] == self.entity_description.trigger_type
-            )
-
-        self.hass.bus.async_listen(
-            MAWAQEET_EVENT,
-            self._async_handle_event,
-            event_filter=filter_event,
         )
 
     @callback
-    def _async_handle_event(self, event: Event[MawaqeetEventData]) -> None:
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the availability changes."""
+        # Events only change on prayer events, not on coordinator updates
+        if (available := self.available) != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
+
+    @callback
+    def _async_handle_event(self, prayer: str) -> None:
         """Handle event."""
-        prayer = event.data.get(PRAYER)
         self._trigger_event(prayer)
         self.async_write_ha_state()
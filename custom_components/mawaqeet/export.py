@@ -0,0 +1,155 @@
+"""Prayer timetable export for mawaqeet."""
+
+from __future__ import annotations
+
+import csv
+import json
+from typing import TYPE_CHECKING, TextIO
+
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN, NAME
+from .enum import ExportFormat, PrayerTime
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from datetime import date, datetime
+    from pathlib import Path
+
+    from .coordinator import PrayerTimeEntries
+
+type TimetableDays = Iterable[tuple[date, PrayerTimeEntries | None]]
+
+FILE_EXTENSIONS: dict[ExportFormat, str] = {
+    ExportFormat.CSV: "csv",
+    ExportFormat.JSON: "json",
+    ExportFormat.ICAL: "ics",
+}
+
+ICAL_DATETIME_FORMAT = "%Y%m%dT%H%M%SZ"
+ICAL_LINE_OCTETS = 75
+
+
+def _local_isoformat(value: datetime | None) -> str | None:
+    return dt_util.as_local(value).isoformat() if value is not None else None
+
+
+def _write_csv(file: TextIO, days: TimetableDays, _: str) -> int:
+    writer = csv.writer(file)
+    writer.writerow(["date", *PrayerTime])
+
+    count = 0
+    for day, prayer_times in days:
+        writer.writerow(
+            [
+                day.isoformat(),
+                *(
+                    _local_isoformat(prayer_times.get(prayer)) if prayer_times else ""
+                    for prayer in PrayerTime
+                ),
+            ]
+        )
+        count += 1
+    return count
+
+
+def _write_json(file: TextIO, days: TimetableDays, _: str) -> int:
+    count = 0
+    file.write("[")
+    for day, prayer_times in days:
+        record = {
+            "date": day.isoformat(),
+            **{
+                prayer: _local_isoformat(prayer_times.get(prayer))
+                if prayer_times
+                else None
+                for prayer in PrayerTime
+            },
+        }
+        file.write(("," if count else "") + "\n  " + json.dumps(record))
+        count += 1
+    file.write("\n]\n")
+    return count
+
+
+def _ical_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _ical_fold(line: str) -> str:
+    """Fold a content line every 75 octets, never within a UTF-8 sequence."""
+    data = line.encode()
+    parts: list[str] = []
+    start = 0
+    limit = ICAL_LINE_OCTETS
+    while len(data) - start > limit:
+        end = start + limit
+        # Continuation bytes of a UTF-8 sequence are 0b10xxxxxx
+        while data[end] & 0xC0 == 0x80:  # noqa: PLR2004
+            end -= 1
+        parts.append(data[start:end].decode())
+        start = end
+        # The space beginning a continuation line counts as well
+        limit = ICAL_LINE_OCTETS - 1
+    parts.append(data[start:].decode())
+    return "\r\n ".join(parts)
+
+
+def _write_ical(file: TextIO, days: TimetableDays, name: str) -> int:
+    def write(*lines: str) -> None:
+        # iCalendar lines end with CRLF
+        file.writelines(f"{_ical_fold(line)}\r\n" for line in lines)
+
+    stamp = dt_util.utcnow().strftime(ICAL_DATETIME_FORMAT)
+    write(
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//{NAME}//{DOMAIN}//EN",
+        f"X-WR-CALNAME:{_ical_text(name)}",
+    )
+
+    count = 0
+    for day, prayer_times in days:
+        for prayer, prayer_dt in (prayer_times or {}).items():
+            start = dt_util.as_utc(prayer_dt).strftime(ICAL_DATETIME_FORMAT)
+            write(
+                "BEGIN:VEVENT",
+                f"UID:{day.isoformat()}-{prayer}-{_ical_text(name)}@{DOMAIN}",
+                f"DTSTAMP:{stamp}",
+                f"DTSTART:{start}",
+                f"SUMMARY:{prayer.label}",
+                "END:VEVENT",
+            )
+        count += 1
+
+    write("END:VCALENDAR")
+    return count
+
+
+WRITERS: dict[ExportFormat, Callable[[TextIO, TimetableDays, str], int]] = {
+    ExportFormat.CSV: _write_csv,
+    ExportFormat.JSON: _write_json,
+    ExportFormat.ICAL: _write_ical,
+}
+
+
+def export_timetable(
+    days: TimetableDays,
+    path: Path,
+    export_format: ExportFormat,
+    name: str,
+) -> int:
+    """
+    Stream a timetable to a file and return the number of exported days.
+
+    Days are consumed one at a time and written as they come, so a lazily
+    computed timetable is never held in memory as a whole.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as file:
+        return WRITERS[export_format](file, days, name)
@@ -0,0 +1,112 @@
+"""Hijri calendar conversions for mawaqeet."""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, NamedTuple
+
+from .enum import HijriCalendar
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from homeassistant.core import HomeAssistant
+
+# Julian day number of the day before 1 Muharram 1 AH in the tabular calendar
+HIJRI_EPOCH = 1948439
+# Offset from the proleptic Gregorian ordinal of a day to its Julian day number
+ORDINAL_TO_JULIAN_DAY = 1721425
+
+UMM_AL_QURA_MODULE = "hijridate"
+
+MONTH_NAMES = (
+    "Muharram",
+    "Safar",
+    "Rabi al-Awwal",
+    "Rabi al-Thani",
+    "Jumada al-Awwal",
+    "Jumada al-Thani",
+    "Rajab",
+    "Shaban",
+    "Ramadan",
+    "Shawwal",
+    "Dhu al-Qadah",
+    "Dhu al-Hijjah",
+)
+
+
+class HijriDate(NamedTuple):
+    """Day of the Hijri calendar."""
+
+    year: int
+    month: int
+    day: int
+
+    @property
+    def month_name(self) -> str:
+        """Return the transliterated name of the month."""
+        return MONTH_NAMES[self.month - 1]
+
+    def isoformat(self) -> str:
+        """Return the date formatted as YYYY-MM-DD."""
+        return f"{self.year:04}-{self.month:02}-{self.day:02}"
+
+
+def _tabular_month_start(year: int, month: int) -> int:
+    """Return the Julian day number of the day before the first of a month."""
+    return (
+        HIJRI_EPOCH
+        + (year - 1) * 354
+        + (3 + 11 * year) // 30
+        # Months alternate between 30 and 29 days
+        + (59 * (month - 1) + 1) // 2
+    )
+
+
+def to_tabular_hijri(day: date) -> HijriDate:
+    """
+    Convert a day to the tabular Hijri calendar.
+
+    The arithmetic calendar of 30 year cycles, with the leap years of the
+    civil (Kuwaiti) variant.
+    """
+    julian_day = day.toordinal() + ORDINAL_TO_JULIAN_DAY
+    # Estimate from the mean year of 10631 / 30 days, then settle the year
+    year = (30 * (julian_day - HIJRI_EPOCH) + 10646) // 10631
+    while _tabular_month_start(year, 1) >= julian_day:
+        year -= 1
+    while _tabular_month_start(year + 1, 1) < julian_day:
+        year += 1
+    month = 12
+    while month > 1 and _tabular_month_start(year, month) >= julian_day:
+        month -= 1
+    return HijriDate(year, month, julian_day - _tabular_month_start(year, month))
+
+
+def to_umm_al_qura_hijri(day: date) -> HijriDate:
+    """
+    Convert a day to the Umm al-Qura calendar.
+
+    Falls back to the tabular calendar outside of the years covered by the
+    Umm al-Qura table. The table is imported on first use, load it with
+    `async_load_calendar` beforehand to keep the import out of the event loop.
+    """
+    gregorian = import_module(UMM_AL_QURA_MODULE).Gregorian
+    try:
+        hijri = gregorian.fromdate(day).to_hijri()
+    except OverflowError:
+        return to_tabular_hijri(day)
+    return HijriDate(hijri.year, hijri.month, hijri.day)
+
+
+def to_hijri(day: date, calendar: HijriCalendar) -> HijriDate:
+    """Convert a day to a Hijri calendar."""
+    if calendar == HijriCalendar.UMM_AL_QURA:
+        return to_umm_al_qura_hijri(day)
+    return to_tabular_hijri(day)
+
+
+async def async_load_calendar(hass: HomeAssistant, calendar: HijriCalendar) -> None:
+    """Load the table of a Hijri calendar, if it has one, in the executor."""
+    if calendar == HijriCalendar.UMM_AL_QURA:
+        await hass.async_add_import_executor_job(import_module, UMM_AL_QURA_MODULE)
@@ -0,0 +1,80 @@
+"""Instrumentation of the hot paths of mawaqeet, reported by the diagnostics."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from logging import DEBUG
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any
+
+from .const import DIAGNOSTICS_SAMPLES, LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+
+def _summary(samples: Iterable[float]) -> dict[str, Any]:
+    """Return a summary of samples in seconds, in milliseconds."""
+    milliseconds = [round(sample * 1000, 3) for sample in samples]
+    return {
+        "count": len(milliseconds),
+        "mean": round(sum(milliseconds) / len(milliseconds), 3)
+        if milliseconds
+        else None,
+        "max": max(milliseconds, default=None),
+        "samples": milliseconds,
+    }
+
+
+class Timings:
+    """
+    Recent timings of a coordinator.
+
+    Samples are in seconds and only the latest ones are kept. Computations
+    are timed in executor threads, appending to a deque is thread-safe.
+    """
+
+    def __init__(self, size: int = DIAGNOSTICS_SAMPLES) -> None:
+        """Initialize."""
+        self.compute: deque[float] = deque(maxlen=size)
+        self.queue_wait: deque[float] = deque(maxlen=size)
+        self.schedule: deque[float] = deque(maxlen=size)
+        self.fire: deque[float] = deque(maxlen=size)
+
+    def queued[T](self, target: Callable[[], T]) -> Callable[[], T]:
+        """Wrap an executor job to time how long it waits for a thread."""
+        submitted = monotonic()
+
+        def job() -> T:
+            self.queue_wait.append(monotonic() - submitted)
+            return target()
+
+        return job
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings in a JSON serializable form."""
+        return {
+            "compute_ms": _summary(self.compute),
+            "queue_wait_ms": _summary(self.queue_wait),
+            "schedule_ms": _summary(self.schedule),
+            "fire_ms": _summary(self.fire),
+        }
+
+
+@contextmanager
+def timed(samples: deque[float], msg: str, *args: object) -> Iterator[None]:
+    """
+    Time a block into `samples`.
+
+    The duration is only logged, after `msg` and `args`, when debug logging
+    is enabled, so the block does no logging work by default.
+    """
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - started
+        samples.append(elapsed)
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug("%s in %.3f ms", msg % args if args else msg, elapsed * 1000)
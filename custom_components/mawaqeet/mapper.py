@@ -1,6 +1,8 @@
 """Mawaqeet Mapper module."""
 
-from typing import NotRequired, TypedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, NotRequired, TypedDict
 
 from adhanpy.calculation.HighLatitudeRule import (
     HighLatitudeRule as AdhanHighLatitudeRule,
@@ -39,41 +41,16 @@ class CalculationMethodMapper:
     @staticmethod
     def to_adhanpy(
         calc_method: CalculationMethod | str,
-    ) -> AdhanCalculationMethodParameter:
-        """Map Calculation method to AdhanPy Data."""
-        if isinstance(calc_method, str):
-            method = CalculationMethod(calc_method)
-        else:
-            method = calc_method
+    ) -> Mapping[str, Any]:
+        """
+        Map Calculation method to AdhanPy Data.
 
-        calculation_parameters = AdhanCalculationMethodParameter()
-
-        calc_method_params = CALCULATION_METHOD_PARAMETERS.get(method)
-
-        if calc_method_params is None:
-            return calculation_parameters
-
-        calc_method_params = calc_method_params.copy()
-
-        if calc_method_params is None:
-            return calculation_parameters
-
-        if (method_adj := calc_method_params.get(METHOD_ADJUSTMENTS)) is not None:
-            method_adj = PrayerAdjustments(**method_adj)
-            calculation_parameters[ADHANPY_METHOD_ADJUSTMENTS] = (
-                PrayerAdjustmentMapper.to_adhanpy(method_adj)
-            )
-
-        if (fajr_angle := calc_method_params.get(FAJR_ANGLE)) is not None:
-            calculation_parameters[ADHANPY_FAJR_ANGLE] = fajr_angle
-
-        if (ishaa_angle := calc_method_params.get(ISHAA_ANGLE)) is not None:
-            calculation_parameters[ADHANPY_ISHAA_ANGLE] = ishaa_angle
-
-        if (ishaa_interval := calc_method_params.get(ISHAA_INTERVAL)) is not None:
-            calculation_parameters[ADHANPY_ISHAA_INTERVAL] = ishaa_interval
-
-        return calculation_parameters
+        The parameters are precompiled and shared, they must not be mutated.
+        """
+        if (parameters := ADHANPY_CALCULATION_METHODS.get(calc_method)) is None:
+            # Raises for unknown calculation methods
+            parameters = ADHANPY_CALCULATION_METHODS[CalculationMethod(calc_method)]
+        return parameters
 
 
 class MadhabMapper:
@@ -85,15 +62,10 @@ class MadhabMapper:
         if madhab is None:
             return AdhanMadhab.SHAFI
 
-        _madhab = Madhab(madhab)
-
-        match _madhab:
-            case Madhab.SHAFI:
-                return AdhanMadhab.SHAFI
-            case Madhab.HANAFI:
-                return AdhanMadhab.HANAFI
-            case _:
-                return AdhanMadhab.SHAFI
+        if (adhan_madhab := ADHANPY_MADHABS.get(madhab)) is None:
+            # Raises for unknown madhabs
+            adhan_madhab = ADHANPY_MADHABS[Madhab(madhab)]
+        return adhan_madhab
 
     @staticmethod
     def to_mawaqeet(madhab: AdhanMadhab | None) -> Madhab:
@@ -101,11 +73,7 @@ class MadhabMapper:
         if madhab is None:
             return Madhab.SHAFI
 
-        match madhab:
-            case AdhanMadhab.SHAFI:
-                return Madhab.SHAFI
-            case AdhanMadhab.HANAFI:
-                return Madhab.HANAFI
+        return MAWAQEET_MADHABS[madhab]
 
 
 class HighLatitudeRuleMapper:
@@ -117,17 +85,12 @@ class HighLatitudeRuleMapper:
         if high_latitude_rule is None:
             return AdhanHighLatitudeRule.MIDDLE_OF_THE_NIGHT
 
-        _high_latitude_rule = HighLatitudeRule(high_latitude_rule)
-
-        match _high_latitude_rule:
-            case HighLatitudeRule.MIDDLE_OF_THE_NIGHT:
-                return AdhanHighLatitudeRule.MIDDLE_OF_THE_NIGHT
-            case HighLatitudeRule.SEVENTH_OF_THE_NIGHT:
-                return AdhanHighLatitudeRule.SEVENTH_OF_THE_NIGHT
-            case HighLatitudeRule.TWILIGHT_ANGLE:
-                return AdhanHighLatitudeRule.TWILIGHT_ANGLE
-            case _:
-                return AdhanHighLatitudeRule.MIDDLE_OF_THE_NIGHT
+        if (adhan_rule := ADHANPY_HIGH_LATITUDE_RULES.get(high_latitude_rule)) is None:
+            # Raises for unknown high latitude rules
+            adhan_rule = ADHANPY_HIGH_LATITUDE_RULES[
+                HighLatitudeRule(high_latitude_rule)
+            ]
+        return adhan_rule
 
     @staticmethod
     def to_mawaqeet(
@@ -137,13 +100,7 @@ class HighLatitudeRuleMapper:
         if high_latitude_rule is None:
             return HighLatitudeRule.MIDDLE_OF_THE_NIGHT
 
-        match high_latitude_rule:
-            case AdhanHighLatitudeRule.MIDDLE_OF_THE_NIGHT:
-                return HighLatitudeRule.MIDDLE_OF_THE_NIGHT
-            case AdhanHighLatitudeRule.SEVENTH_OF_THE_NIGHT:
-                return HighLatitudeRule.SEVENTH_OF_THE_NIGHT
-            case AdhanHighLatitudeRule.TWILIGHT_ANGLE:
-                return HighLatitudeRule.TWILIGHT_ANGLE
+        return MAWAQEET_HIGH_LATITUDE_RULES[high_latitude_rule]
 
 
 class PrayerAdjustmentMapper:
@@ -174,3 +131,72 @@ class PrayerAdjustmentMapper:
             prayer_adjustments.maghrib,
             prayer_adjustments.isha,
         )
+
+
+def _compile_calculation_method(
+    method: CalculationMethod,
+) -> AdhanCalculationMethodParameter:
+    calculation_parameters = AdhanCalculationMethodParameter()
+
+    calc_method_params = CALCULATION_METHOD_PARAMETERS.get(method)
+
+    if calc_method_params is None:
+        return calculation_parameters
+
+    if (method_adj := calc_method_params.get(METHOD_ADJUSTMENTS)) is not None:
+        method_adj = PrayerAdjustments(**method_adj)
+        calculation_parameters[ADHANPY_METHOD_ADJUSTMENTS] = (
+            PrayerAdjustmentMapper.to_adhanpy(method_adj)
+        )
+
+    if (fajr_angle := calc_method_params.get(FAJR_ANGLE)) is not None:
+        calculation_parameters[ADHANPY_FAJR_ANGLE] = fajr_angle
+
+    if (ishaa_angle := calc_method_params.get(ISHAA_ANGLE)) is not None:
+        calculation_parameters[ADHANPY_ISHAA_ANGLE] = ishaa_angle
+
+    if (ishaa_interval := calc_method_params.get(ISHAA_INTERVAL)) is not None:
+        calculation_parameters[ADHANPY_ISHAA_INTERVAL] = ishaa_interval
+
+    return calculation_parameters
+
+
+# Mappings are compiled once at import, adhanpy shares its method
+# adjustments between calculation parameters the same way
+ADHANPY_CALCULATION_METHODS: Mapping[CalculationMethod | str, Mapping[str, Any]] = (
+    MappingProxyType(
+        {
+            method: MappingProxyType(_compile_calculation_method(method))
+            for method in CalculationMethod
+        }
+    )
+)
+
+ADHANPY_MADHABS: Mapping[Madhab | str, AdhanMadhab] = MappingProxyType(
+    {
+        Madhab.SHAFI: AdhanMadhab.SHAFI,
+        Madhab.HANAFI: AdhanMadhab.HANAFI,
+    }
+)
+MAWAQEET_MADHABS: Mapping[AdhanMadhab, Madhab] = MappingProxyType(
+    {adhan: madhab for madhab, adhan in ADHANPY_MADHABS.items()}
+)
+
+ADHANPY_HIGH_LATITUDE_RULES: Mapping[HighLatitudeRule | str, AdhanHighLatitudeRule] = (
+    MappingProxyType(
+        {
+            HighLatitudeRule.MIDDLE_OF_THE_NIGHT: (
+                AdhanHighLatitudeRule.MIDDLE_OF_THE_NIGHT
+            ),
+            HighLatitudeRule.SEVENTH_OF_THE_NIGHT: (
+                AdhanHighLatitudeRule.SEVENTH_OF_THE_NIGHT
+            ),
+            HighLatitudeRule.TWILIGHT_ANGLE: AdhanHighLatitudeRule.TWILIGHT_ANGLE,
+        }
+    )
+)
+MAWAQEET_HIGH_LATITUDE_RULES: Mapping[AdhanHighLatitudeRule, HighLatitudeRule] = (
+    MappingProxyType(
+        {adhan: rule for rule, adhan in ADHANPY_HIGH_LATITUDE_RULES.items()}
+    )
+)
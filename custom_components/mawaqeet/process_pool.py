@@ -0,0 +1,129 @@
+"""Process pool for large prayer time computations of mawaqeet."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .const import DOMAIN, LOGGER, PROCESS_POOL
+from .solar import SolarParameters, SolarPrayerTimes, compute_prayer_times
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+
+class MawaqeetProcessPool:
+    """
+    Process pool shared by every config entry of the integration.
+
+    Entries request a number of worker processes, the pool is started on
+    its first computation with the largest requested number, and is shut
+    down once no entry requests workers anymore. Computations are submitted
+    from executor threads, which wait for the result without holding the
+    GIL of Home Assistant.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._requests: dict[str, int] = {}
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_workers = 0
+        self._lock = Lock()
+
+    @property
+    def workers(self) -> int:
+        """Return the number of requested worker processes, 0 when disabled."""
+        return max(self._requests.values(), default=0)
+
+    @callback
+    def async_request_workers(self, owner: str, workers: int) -> CALLBACK_TYPE:
+        """Request worker processes for an owner until the returned callback."""
+        with self._lock:
+            self._requests[owner] = workers
+        self._async_shutdown_outdated()
+
+        @callback
+        def release() -> None:
+            with self._lock:
+                self._requests.pop(owner, None)
+            self._async_shutdown_outdated()
+
+        return release
+
+    @callback
+    def _async_shutdown_outdated(self) -> None:
+        with self._lock:
+            if (executor := self._executor) is None:
+                return
+            if self._executor_workers == self.workers:
+                return
+            self._executor = None
+            LOGGER.debug("Shutting down %s worker process(es)", self._executor_workers)
+
+        # Pending computations complete before the workers exit
+        self._hass.async_add_executor_job(executor.shutdown)
+
+    @callback
+    def async_shutdown(self, _: Event | None = None) -> None:
+        """Shut the pool down, it is started again by the next computation."""
+        with self._lock:
+            self._requests.clear()
+        self._async_shutdown_outdated()
+
+    def compute(
+        self,
+        latitude: ArrayLike,
+        longitude: ArrayLike,
+        day: ArrayLike,
+        parameters: SolarParameters,
+    ) -> SolarPrayerTimes | None:
+        """
+        Compute prayer times in a worker process, None when disabled.
+
+        Also None when a worker died or the pool was shut down meanwhile, the
+        caller computes in its own thread then, and the pool is started again
+        by the next computation.
+        """
+        with self._lock:
+            if (workers := self.workers) == 0:
+                return None
+            if (executor := self._executor) is None:
+                LOGGER.debug("Starting %s worker process(es)", workers)
+                # Forking the threads of Home Assistant is unsafe
+                executor = self._executor = ProcessPoolExecutor(
+                    workers, mp_context=get_context("spawn")
+                )
+                self._executor_workers = workers
+
+        try:
+            return executor.submit(
+                compute_prayer_times, latitude, longitude, day, parameters
+            ).result()
+        except (BrokenProcessPool, RuntimeError) as err:
+            LOGGER.warning("Computing without the worker processes: %s", err)
+            self.__reset(executor)
+            return None
+
+    def __reset(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        # Computations are submitted from executor threads, no need to wait
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@callback
+def async_get_process_pool(hass: HomeAssistant) -> MawaqeetProcessPool:
+    """Return the process pool of the integration."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (pool := domain_data.get(PROCESS_POOL)) is None:
+        pool = domain_data[PROCESS_POOL] = MawaqeetProcessPool(hass)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, pool.async_shutdown)
+    return pool
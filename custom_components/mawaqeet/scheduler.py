@@ -0,0 +1,205 @@
+"""Prayer event scheduler for mawaqeet."""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from itertools import count
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+
+from .const import DOMAIN, LOGGER, SCHEDULER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from datetime import datetime
+
+
+type EventKey = tuple[str, str, datetime]
+type EventSpec = tuple[datetime, str, str, Callable[[datetime], Any]]
+
+
+@dataclass(order=True, slots=True)
+class ScheduledEvent:
+    """Event scheduled for a config entry."""
+
+    when: datetime
+    sequence: int
+    owner: str = field(compare=False)
+    trigger: str = field(compare=False)
+    prayer: str = field(compare=False)
+    job: HassJob[[datetime], Any] = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+    @property
+    def key(self) -> EventKey:
+        """Return the trigger, prayer and instant identifying the event."""
+        return self.trigger, self.prayer, self.when
+
+
+class MawaqeetScheduler:
+    """
+    Scheduler shared by every config entry of the integration.
+
+    Upcoming events are kept in a min-heap and a single Home Assistant
+    timer is armed for the earliest of them. Events are indexed by owner,
+    a config entry or a site, and by key. Cancelled events are only flagged,
+    they are dropped once they reach the top of the heap or outnumber the
+    pending events.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._heap: list[ScheduledEvent] = []
+        self._events: dict[str, dict[EventKey, ScheduledEvent]] = {}
+        self._cancelled = 0
+        self._sequence = count()
+        self._timer_unsub: CALLBACK_TYPE | None = None
+        self._armed_at: datetime | None = None
+
+    def __len__(self) -> int:
+        """Return the number of pending events."""
+        return len(self._heap) - self._cancelled
+
+    @property
+    def timers(self) -> int:
+        """Return the number of armed Home Assistant timers."""
+        return int(self._timer_unsub is not None)
+
+    def pending(self, owner: str) -> int:
+        """Return the number of pending events of an owner."""
+        return len(self._events.get(owner, {}))
+
+    def events(self, owner: str) -> list[ScheduledEvent]:
+        """Return the pending events of an owner, earliest first."""
+        return sorted(self._events.get(owner, {}).values())
+
+    @callback
+    def async_schedule(  # noqa: PLR0913
+        self,
+        owner: str,
+        when: datetime,
+        trigger: str,
+        prayer: str,
+        action: Callable[[datetime], Any],
+    ) -> None:
+        """
+        Schedule `action` to be called with `when` at that point in time.
+
+        An event of the same owner, trigger, prayer and instant is only
+        scheduled once.
+        """
+        events = self._events.setdefault(owner, {})
+        if (key := (trigger, prayer, when)) not in events:
+            events[key] = self.__push(owner, key, action)
+            self._async_arm()
+
+    @callback
+    def async_reschedule(self, owner: str, specs: Iterable[EventSpec]) -> None:
+        """
+        Replace the pending events of an owner.
+
+        Pending events that are scheduled again are kept as they are, the
+        other ones are cancelled.
+        """
+        previous = self._events.pop(owner, {})
+        events: dict[EventKey, ScheduledEvent] = {}
+
+        for when, trigger, prayer, action in specs:
+            key = (trigger, prayer, when)
+            if key not in events:
+                events[key] = previous.pop(key, None) or self.__push(owner, key, action)
+
+        for event in previous.values():
+            event.cancelled = True
+        self._cancelled += len(previous)
+
+        if events:
+            self._events[owner] = events
+        self.__compact()
+        self._async_arm()
+
+    @callback
+    def async_cancel(self, owner: str) -> None:
+        """Cancel every pending event of an owner."""
+        self.async_reschedule(owner, ())
+
+    def __push(
+        self, owner: str, key: EventKey, action: Callable[[datetime], Any]
+    ) -> ScheduledEvent:
+        trigger, prayer, when = key
+        event = ScheduledEvent(
+            when, next(self._sequence), owner, trigger, prayer, HassJob(action)
+        )
+        heapq.heappush(self._heap, event)
+        return event
+
+    def __compact(self) -> None:
+        while self._heap and self._heap[0].cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+
+        if self._cancelled > len(self._heap) // 2:
+            self._heap = [event for event in self._heap if not event.cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the timer for the earliest pending event."""
+        next_at = self._heap[0].when if self._heap else None
+        if next_at == self._armed_at:
+            return
+
+        if self._timer_unsub is not None:
+            self._timer_unsub()
+            self._timer_unsub = None
+
+        self._armed_at = next_at
+        if next_at is not None:
+            self._timer_unsub = async_track_point_in_time(
+                self._hass, self._async_fire, next_at
+            )
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Run every event that is due."""
+        self._timer_unsub = None
+        self._armed_at = None
+
+        while self._heap and self._heap[0].when <= now:
+            event = heapq.heappop(self._heap)
+            if event.cancelled:
+                self._cancelled -= 1
+                continue
+
+            events = self._events[event.owner]
+            del events[event.key]
+            if not events:
+                del self._events[event.owner]
+
+            try:
+                self._hass.async_run_hass_job(event.job, event.when)
+            except Exception:  # noqa: BLE001
+                # The other due events and the timer must not depend on it
+                LOGGER.exception(
+                    "Error running %s of %s for %s",
+                    event.trigger,
+                    event.prayer,
+                    event.owner,
+                )
+
+        self.__compact()
+        self._async_arm()
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> MawaqeetScheduler:
+    """Return the scheduler of the integration."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := domain_data.get(SCHEDULER)) is None:
+        scheduler = domain_data[SCHEDULER] = MawaqeetScheduler(hass)
+    return scheduler
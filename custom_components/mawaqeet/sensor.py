@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
+import homeassistant.util.dt as dt_util
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorEntityDescription,
 )
 from homeassistant.components.sensor.const import SensorDeviceClass
 from homeassistant.const import EntityCategory
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN
+from .const import PRAYER_TIME_TRIGGER
 from .entity import MawaqeetEntity
-from .enum import PrayerTime, PrayerTimeOption
+from .enum import HijriCalendar, PrayerTime, PrayerTimeOption
+from .hijri import to_hijri
+from .site_group import get_entry_coordinators
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from datetime import date, datetime
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
@@ -99,18 +105,67 @@ ENTITY_DESCRIPTIONS = (
 )
 
 
+CURRENT_PRAYER = "current_prayer"
+NEXT_PRAYER = "next_prayer"
+NEXT_PRAYER_TIME = "next_prayer_time"
+
+NEXT_PRAYER_ENTITY_DESCRIPTIONS = (
+    SensorEntityDescription(
+        key=CURRENT_PRAYER,
+        translation_key=CURRENT_PRAYER,
+        device_class=SensorDeviceClass.ENUM,
+        options=[str(prayer_time) for prayer_time in PrayerTime],
+    ),
+    SensorEntityDescription(
+        key=NEXT_PRAYER,
+        translation_key=NEXT_PRAYER,
+        device_class=SensorDeviceClass.ENUM,
+        options=[str(prayer_time) for prayer_time in PrayerTime],
+    ),
+    SensorEntityDescription(
+        key=NEXT_PRAYER_TIME,
+        translation_key=NEXT_PRAYER_TIME,
+        device_class=SensorDeviceClass.TIMESTAMP,
+    ),
+)
+
+
+HIJRI_DATE = "hijri_date"
+
+HIJRI_DATE_ENTITY_DESCRIPTION = SensorEntityDescription(
+    key=HIJRI_DATE,
+    translation_key=HIJRI_DATE,
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_devices: AddEntitiesCallback
 ) -> None:
     """Set up the sensor platform."""
-    coordinator: MawaqeetDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators = get_entry_coordinators(hass, entry)
     async_add_devices(
         MawaqeetSensor(
             coordinator=coordinator,
             entity_description=entity_description,
         )
+        for coordinator in coordinators
         for entity_description in ENTITY_DESCRIPTIONS
     )
+    async_add_devices(
+        MawaqeetNextPrayerSensor(
+            coordinator=coordinator,
+            entity_description=entity_description,
+        )
+        for coordinator in coordinators
+        for entity_description in NEXT_PRAYER_ENTITY_DESCRIPTIONS
+    )
+    async_add_devices(
+        MawaqeetHijriDateSensor(
+            coordinator=coordinator,
+            entity_description=HIJRI_DATE_ENTITY_DESCRIPTION,
+        )
+        for coordinator in coordinators
+    )
 
 
 class MawaqeetSensor(MawaqeetEntity, SensorEntity):
@@ -124,15 +179,165 @@ class MawaqeetSensor(MawaqeetEntity, SensorEntity):
         """Initialize the sensor class."""
         super().__init__(coordinator, entity_description.key)
         self.entity_description = entity_description
+        self._last_available = True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the value or availability changed."""
+        available = self.available
+        if (
+            available == self._last_available
+            and self.entity_description.key not in self.coordinator.changed_keys
+        ):
+            return
+
+        self._last_available = available
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> datetime | Any | None:
         """Return the native value of the sensor."""
         key = self.entity_description.key
         if key in PrayerTime:
-            prayer_time = PrayerTime(key)
-            value = self.coordinator.data["prayer_times"].get(prayer_time)
-        elif key in PrayerTimeOption:
-            prayer_time_option = PrayerTimeOption(key)
-            value = self.coordinator.data["prayer_times_config"].get(prayer_time_option)
+            return self.coordinator.data.prayer_times[PrayerTime(key)]
+
+        prayer_time_option = PrayerTimeOption(key)
+        if (value := self.coordinator.data.get_option(prayer_time_option)) is None:
+            value = self.coordinator.prayer_times_config.get(prayer_time_option)
         return value
+
+
+class MawaqeetNextPrayerSensor(MawaqeetEntity, SensorEntity):
+    """
+    Mawaqeet Next Prayer Sensor class, also used for the current prayer.
+
+    The state only changes at prayer times, when the coordinator dispatches
+    its prayer time events, or when the coordinator refreshes.
+    """
+
+    def __init__(
+        self,
+        coordinator: MawaqeetDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, entity_description.key)
+        self.entity_description = entity_description
+        self._last_available = True
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.coordinator.prayer_event_signal(PRAYER_TIME_TRIGGER),
+                self._handle_prayer_event,
+            )
+        )
+        self._update_native_value()
+
+    def _update_native_value(self) -> bool:
+        """Update the current or next prayer, return if it changed."""
+        now = dt_util.utcnow()
+        value: PrayerTime | datetime | None = None
+        if self.entity_description.key == CURRENT_PRAYER:
+            if current_prayer := self.coordinator.get_current_prayer(now):
+                value = current_prayer[0]
+        elif next_prayer := self.coordinator.get_next_prayer(now):
+            prayer, prayer_dt = next_prayer
+            value = prayer if self.entity_description.key == NEXT_PRAYER else prayer_dt
+
+        changed = value != self._attr_native_value
+        self._attr_native_value = value
+        return changed
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the value or availability changed."""
+        available = self.available
+        if not self._update_native_value() and available == self._last_available:
+            return
+
+        self._last_available = available
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_prayer_event(self, _: str) -> None:
+        """Move to the next prayer once a prayer time is reached."""
+        if self._update_native_value():
+            self.async_write_ha_state()
+
+
+class MawaqeetHijriDateSensor(MawaqeetEntity, SensorEntity):
+    """
+    Mawaqeet Hijri Date Sensor class.
+
+    The Hijri day begins at Maghrib, so the date is only converted at the
+    Maghrib prayer time event, or when a refresh moves to another day.
+    """
+
+    def __init__(
+        self,
+        coordinator: MawaqeetDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, entity_description.key)
+        self.entity_description = entity_description
+        self._last_available = True
+        self._converted: tuple[date, HijriCalendar] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self.coordinator.prayer_event_signal(PRAYER_TIME_TRIGGER),
+                self._handle_prayer_event,
+            )
+        )
+        self._update_native_value()
+
+    def _update_native_value(self) -> bool:
+        """Convert the day if it or the calendar changed, return if it did."""
+        if self.coordinator.data is None:
+            return False
+
+        prayer_times = self.coordinator.data.prayer_times
+        day = prayer_times.day
+        if dt_util.utcnow() >= prayer_times.maghrib:
+            day += timedelta(days=1)
+
+        converted = day, self.coordinator.hijri_calendar
+        if converted == self._converted:
+            return False
+        self._converted = converted
+
+        hijri_date = to_hijri(*converted)
+        self._attr_native_value = hijri_date.isoformat()
+        self._attr_extra_state_attributes = {
+            "year": hijri_date.year,
+            "month": hijri_date.month,
+            "day": hijri_date.day,
+            "month_name": hijri_date.month_name,
+            "calendar": str(converted[1]),
+        }
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if the value or availability changed."""
+        available = self.available
+        if not self._update_native_value() and available == self._last_available:
+            return
+
+        self._last_available = available
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_prayer_event(self, prayer: str) -> None:
+        """Move to the next Hijri day at Maghrib."""
+        if prayer == PrayerTime.MAGHRIB and self._update_native_value():
+            self.async_write_ha_state()
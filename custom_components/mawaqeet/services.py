@@ -0,0 +1,196 @@
+"""Services for mawaqeet."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_NAME
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import slugify
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_END_DATE,
+    ATTR_FORMAT,
+    ATTR_START_DATE,
+    DOMAIN,
+    EXPORT_DIR,
+    EXPORT_MAX_DAYS,
+    GET_TIMES_MAX_DAYS,
+    SERVICE_EXPORT_TIMETABLE,
+    SERVICE_GET_TIMES,
+)
+from .enum import ExportFormat
+from .export import FILE_EXTENSIONS, export_timetable
+from .site_group import MawaqeetSiteGroupCoordinator
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from .coordinator import MawaqeetDataUpdateCoordinator
+    from .timetable import DayTimes
+
+EXPORT_TIMETABLE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_START_DATE): cv.date,
+        vol.Required(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_FORMAT, default=str(ExportFormat.CSV)): vol.Coerce(
+            ExportFormat
+        ),
+    }
+)
+
+GET_TIMES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+    }
+)
+
+
+def _validate_date_range(start_date: date, end_date: date, max_days: int) -> None:
+    if not 0 <= (end_date - start_date).days < max_days:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_date_range",
+            translation_placeholders={"max_days": str(max_days)},
+        )
+
+
+def _get_loaded_coordinator(
+    hass: HomeAssistant, entry_id: str
+) -> MawaqeetDataUpdateCoordinator | MawaqeetSiteGroupCoordinator:
+    # Resolved through the config entries, the data of the integration also
+    # holds the objects its entries share
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if (
+        entry is None
+        or entry.domain != DOMAIN
+        or entry.state is not ConfigEntryState.LOADED
+        or (coordinator := hass.data.get(DOMAIN, {}).get(entry_id)) is None
+    ):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"entry_id": entry_id},
+        )
+    return coordinator
+
+
+def _get_entry_coordinators(
+    hass: HomeAssistant, entry_id: str
+) -> list[MawaqeetDataUpdateCoordinator]:
+    coordinator = _get_loaded_coordinator(hass, entry_id)
+    if isinstance(coordinator, MawaqeetSiteGroupCoordinator):
+        return list(coordinator.sites.values())
+    return [coordinator]
+
+
+def _day_times_response(days: list[DayTimes]) -> dict[str, dict[str, str]]:
+    return {
+        day_times.day.isoformat(): {
+            str(prayer): prayer_dt.isoformat()
+            for prayer, prayer_dt in day_times.items()
+        }
+        for day_times in days
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_export_timetable(call: ServiceCall) -> ServiceResponse:
+        """Export the prayer timetable of a date range, a file per location."""
+        coordinators = _get_entry_coordinators(hass, call.data[ATTR_CONFIG_ENTRY_ID])
+        start_date = call.data[ATTR_START_DATE]
+        end_date = call.data[ATTR_END_DATE]
+        export_format = call.data[ATTR_FORMAT]
+
+        _validate_date_range(start_date, end_date, EXPORT_MAX_DAYS)
+
+        files: list[dict[str, Any]] = []
+        for coordinator in coordinators:
+            entry_name = coordinator.config_entry.data[CONF_NAME]
+            # Sites are named after their site group too, to keep files apart
+            if coordinator.site:
+                name = coordinator.site["name"]
+                slug = f"{slugify(entry_name)}_{slugify(name)}"
+            else:
+                name = entry_name
+                slug = slugify(name)
+            filename = (
+                f"{DOMAIN}_{slug}_{start_date}_{end_date}"
+                f".{FILE_EXTENSIONS[export_format]}"
+            )
+            path = Path(hass.config.path(EXPORT_DIR, filename))
+
+            days = await hass.async_add_executor_job(
+                export_timetable,
+                # Long ranges would evict the cached days of every entry
+                coordinator.iter_prayer_times(start_date, end_date, use_cache=False),
+                path,
+                export_format,
+                name,
+            )
+            files.append({"name": name, "path": str(path), "days": days})
+        return {"files": files}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_TIMETABLE,
+        async_export_timetable,
+        schema=EXPORT_TIMETABLE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_get_times(call: ServiceCall) -> ServiceResponse:
+        """Return the prayer times of a date range for several entries at once."""
+        start_date = call.data[ATTR_START_DATE]
+        end_date = call.data.get(ATTR_END_DATE, start_date)
+        _validate_date_range(start_date, end_date, GET_TIMES_MAX_DAYS)
+
+        coordinators = [
+            coordinator
+            for entry_id in dict.fromkeys(call.data[ATTR_CONFIG_ENTRY_ID])
+            for coordinator in _get_entry_coordinators(hass, entry_id)
+        ]
+        results = await asyncio.gather(
+            *(
+                coordinator.async_get_prayer_times(start_date, end_date)
+                for coordinator in coordinators
+            )
+        )
+
+        entries: dict[str, Any] = {
+            coordinator.unique_id: {
+                "name": coordinator.site["name"]
+                if coordinator.site
+                else coordinator.config_entry.data[CONF_NAME],
+                "days": _day_times_response(days),
+            }
+            for coordinator, days in zip(coordinators, results, strict=True)
+        }
+        return {"entries": entries}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TIMES,
+        async_get_times,
+        schema=GET_TIMES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,279 @@
+"""Site group entries of mawaqeet."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+from functools import partial
+from typing import TYPE_CHECKING
+
+import homeassistant.util.dt as dt_util
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import slugify
+
+from .cache import PrayerTimeCache, async_get_cache
+from .const import CONF_SITES, DOMAIN, LOGGER
+from .coordinator import (
+    ComputedDays,
+    Coordinates,
+    MawaqeetData,
+    MawaqeetDataUpdateCoordinator,
+    MawaqeetSite,
+    compute_cached_days,
+)
+from .instrumentation import Timings, timed
+from .process_pool import MawaqeetProcessPool, async_get_process_pool
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date
+
+    from homeassistant.config_entries import ConfigEntry
+
+    from .solar import SolarParameters
+
+type SiteResult = tuple[MawaqeetSiteCoordinator, MawaqeetData | ValueError]
+
+CSV_FIELDS = 3
+
+
+def parse_sites(text: str) -> list[MawaqeetSite]:
+    """
+    Parse sites from CSV lines of name, latitude and longitude.
+
+    A header line is skipped. Raises ValueError on an invalid line, or when
+    two sites have the same name.
+    """
+    sites: list[MawaqeetSite] = []
+    slugs: set[str] = set()
+    first_line = True
+
+    for line_number, row in enumerate(csv.reader(io.StringIO(text)), 1):
+        fields = [field.strip() for field in row]
+        if not any(fields):
+            continue
+        if len(fields) != CSV_FIELDS:
+            msg = f"line {line_number}: expected name, latitude and longitude"
+            raise ValueError(msg)
+
+        name, latitude, longitude = fields
+        try:
+            coordinates = float(latitude), float(longitude)
+        except ValueError:
+            if first_line:
+                first_line = False
+                continue
+            msg = f"line {line_number}: invalid coordinates"
+            raise ValueError(msg) from None
+        first_line = False
+
+        if not (-90 <= coordinates[0] <= 90 and -180 <= coordinates[1] <= 180):  # noqa: PLR2004
+            msg = f"line {line_number}: coordinates out of range"
+            raise ValueError(msg)
+        if not (slug := slugify(name)) or slug in slugs:
+            msg = f"line {line_number}: missing or duplicate name {name!r}"
+            raise ValueError(msg)
+
+        slugs.add(slug)
+        sites.append(
+            {"name": name, "latitude": coordinates[0], "longitude": coordinates[1]}
+        )
+
+    if not sites:
+        msg = "no site"
+        raise ValueError(msg)
+
+    return sites
+
+
+@callback
+def get_entry_coordinators(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> list[MawaqeetDataUpdateCoordinator]:
+    """Return the coordinator of an entry, or of every site of a site group."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    if isinstance(coordinator, MawaqeetSiteGroupCoordinator):
+        return list(coordinator.sites.values())
+    return [coordinator]
+
+
+class MawaqeetSiteCoordinator(MawaqeetDataUpdateCoordinator):
+    """
+    Coordinator of a site of a site group entry.
+
+    Entities, events and timers are per site, refreshes are delegated to
+    the site group so that sites due together are computed together.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        group: MawaqeetSiteGroupCoordinator,
+        site: MawaqeetSite,
+    ) -> None:
+        """Initialize."""
+        super().__init__(hass, config_entry, site=site)
+        self._group = group
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh of the site from its site group."""
+        await self._group.async_request_site_refresh(self)
+
+
+class MawaqeetSiteGroupCoordinator(DataUpdateCoordinator[dict[str, MawaqeetData]]):
+    """
+    Coordinator of a site group entry.
+
+    Every site shares the calculation settings of the entry. A refresh runs
+    a single executor job computing the missing days of every due site in
+    one call to the engine, then hands each site its own data.
+    """
+
+    _cache: PrayerTimeCache
+    _pool: MawaqeetProcessPool
+    _timings: Timings
+    _pending: set[str]
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(
+            hass=hass,
+            logger=LOGGER,
+            name=f"{DOMAIN}_site_group",
+        )
+
+        self.config_entry = config_entry
+        self._cache = async_get_cache(hass)
+        self._pool = async_get_process_pool(hass)
+        self._timings = Timings()
+        self._pending = set()
+        self.sites: dict[str, MawaqeetSiteCoordinator] = {}
+        for site in config_entry.data[CONF_SITES]:
+            coordinator = MawaqeetSiteCoordinator(hass, config_entry, self, site)
+            self.sites[coordinator.unique_id] = coordinator
+
+    @property
+    def timings(self) -> Timings:
+        """Recent timings of batched refreshes."""
+        return self._timings
+
+    async def async_load(self) -> None:
+        """Load the stored prayer time table of every site."""
+        await asyncio.gather(
+            *(coordinator.async_load() for coordinator in self.sites.values())
+        )
+
+    async def async_request_site_refresh(
+        self, coordinator: MawaqeetSiteCoordinator
+    ) -> None:
+        """Refresh a site, along with the other sites due in the meantime."""
+        self._pending.add(coordinator.unique_id)
+        await self.async_request_refresh()
+
+    def __compute_sites(
+        self, coordinators: Sequence[MawaqeetSiteCoordinator]
+    ) -> list[SiteResult]:
+        with timed(
+            self._timings.compute,
+            "Computed prayer times of %s site(s)",
+            len(coordinators),
+        ):
+            return self.__compute_batch(coordinators)
+
+    def __compute_batch(
+        self, coordinators: Sequence[MawaqeetSiteCoordinator]
+    ) -> list[SiteResult]:
+        today = dt_util.now().date()
+
+        # Sites sharing their missing days and parameters are computed at once
+        batches: dict[tuple[SolarParameters, date, int], dict[str, Coordinates]] = {}
+        for coordinator in coordinators:
+            first, days = coordinator.missing_days(today)
+            if days > 0:
+                coordinates, solar_parameters = coordinator.get_location_parameters()
+                batches.setdefault((solar_parameters, first, days), {})[
+                    coordinator.unique_id
+                ] = coordinates
+
+        # Handed to the sites as they are, a batch may not fit in the cache
+        computed: dict[str, ComputedDays] = {}
+        for (solar_parameters, first, days), locations in batches.items():
+            values = compute_cached_days(
+                self._cache,
+                list(locations.values()),
+                solar_parameters,
+                first,
+                days,
+                self._pool,
+            )
+            for unique_id, site_values in zip(locations, values, strict=True):
+                computed[unique_id] = (first, days, site_values)
+
+        results: list[SiteResult] = []
+        for coordinator in coordinators:
+            try:
+                results.append(
+                    (
+                        coordinator,
+                        coordinator.get_new_prayer_times_info(
+                            computed.get(coordinator.unique_id)
+                        ),
+                    )
+                )
+            except ValueError as err:
+                results.append((coordinator, err))
+        return results
+
+    async def _async_update_data(self) -> dict[str, MawaqeetData]:
+        """Update the data of the due sites, every site on the first refresh."""
+        if self.data is None or not self._pending:
+            coordinators = list(self.sites.values())
+        else:
+            coordinators = [self.sites[unique_id] for unique_id in self._pending]
+        self._pending.clear()
+
+        today = dt_util.now().date()
+        computed = [
+            coordinator.unique_id
+            for coordinator in coordinators
+            if coordinator.missing_days(today)[1] > 0
+        ]
+        if computed:
+            results = await self.hass.async_add_executor_job(
+                self._timings.queued(partial(self.__compute_sites, coordinators))
+            )
+        else:
+            # Every day is already computed, no need for the executor
+            results = self.__compute_sites(coordinators)
+
+        data = dict(self.data or {})
+        for coordinator, result in results:
+            if isinstance(result, ValueError):
+                coordinator.async_set_update_error(result)
+                continue
+            coordinator.async_set_computed_data(
+                result, save=coordinator.unique_id in computed
+            )
+            data[coordinator.unique_id] = result
+        return data
+
+    async def async_reconfigure(self) -> None:
+        """Apply changed options in place, refreshing every site at once."""
+        for coordinator in self.sites.values():
+            coordinator.async_apply_options()
+        self._pending.update(self.sites)
+        await self.async_request_refresh()
+
+    async def async_flush(self) -> None:
+        """Write the delayed saves of the prayer time table of every site now."""
+        await asyncio.gather(
+            *(coordinator.async_flush() for coordinator in self.sites.values())
+        )
+
+    def clear_event_sub(self) -> None:
+        """Clean the event subscriptions of every site."""
+        for coordinator in self.sites.values():
+            coordinator.clear_event_sub()
@@ -0,0 +1,412 @@
+"""
+Vectorized solar engine for mawaqeet.
+
+A NumPy port of the astronomical calculations of `adhanpy`, computing the
+prayer times of many days and/or locations in a single call. Inputs are
+broadcast against each other, so a single location over a range of days,
+many locations on a single day, or a full grid can be computed at once.
+
+The results follow `adhanpy.PrayerTimes` step by step, including its
+truncation of times to whole seconds and its rounding to the minute.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from adhanpy.calculation.CalculationParameters import CalculationParameters
+    from numpy.typing import ArrayLike, NDArray
+
+# Julian day of 0001-01-01 00:00 UTC minus one, to offset `date.toordinal()`
+JULIAN_DAY_ORDINAL_OFFSET = 1721424.5
+# `date.toordinal()` of 1970-01-01
+EPOCH_ORDINAL = 719163
+SECONDS_PER_DAY = 86400
+
+SOLAR_ALTITUDE = -50.0 / 60.0
+
+
+class SolarCoordinates(NamedTuple):
+    """Solar coordinates in degrees."""
+
+    declination: NDArray[np.float64]
+    right_ascension: NDArray[np.float64]
+    apparent_sidereal_time: NDArray[np.float64]
+
+
+class SolarPrayerTimes(NamedTuple):
+    """
+    Prayer times in seconds since the epoch (UTC).
+
+    Times that are undefined at a location, like sunrise during a polar
+    night, are NaN.
+    """
+
+    fajr: NDArray[np.float64]
+    sunrise: NDArray[np.float64]
+    dhuhr: NDArray[np.float64]
+    asr: NDArray[np.float64]
+    maghrib: NDArray[np.float64]
+    isha: NDArray[np.float64]
+    night_length: NDArray[np.float64]
+    # From sunset to next sunrise in milliseconds
+
+
+@dataclass(frozen=True, slots=True)
+class SolarParameters:
+    """Calculation parameters understood by the solar engine."""
+
+    fajr_angle: float
+    isha_angle: float
+    isha_interval: float
+    shadow_length: float
+    fajr_portion: float
+    isha_portion: float
+    adjustments: tuple[int, int, int, int, int, int]
+    # Fajr, sunrise, dhuhr, asr, maghrib and isha offsets in minutes
+
+    @classmethod
+    def from_calculation_parameters(
+        cls, calculation_parameters: CalculationParameters
+    ) -> SolarParameters:
+        """Build solar parameters from AdhanPy calculation parameters."""
+        night_portions = calculation_parameters.night_portions()
+        adjustments = calculation_parameters.adjustments
+        method_adjustments = calculation_parameters.method_adjustments
+
+        return cls(
+            fajr_angle=calculation_parameters.fajr_angle,
+            isha_angle=calculation_parameters.isha_angle,
+            isha_interval=calculation_parameters.isha_interval or 0,
+            shadow_length=calculation_parameters.madhab.get_shadow_length().shadow_length,
+            fajr_portion=night_portions.fajr,
+            isha_portion=night_portions.isha,
+            adjustments=(
+                adjustments.fajr + method_adjustments.fajr,
+                adjustments.sunrise + method_adjustments.sunrise,
+                adjustments.dhuhr + method_adjustments.dhuhr,
+                adjustments.asr + method_adjustments.asr,
+                adjustments.maghrib + method_adjustments.maghrib,
+                adjustments.isha + method_adjustments.isha,
+            ),
+        )
+
+
+def _normalize_with_bound(
+    value: NDArray[np.float64], bound: float
+) -> NDArray[np.float64]:
+    return value - (bound * np.floor(value / bound))
+
+
+def _unwind_angle(value: NDArray[np.float64]) -> NDArray[np.float64]:
+    return _normalize_with_bound(value, 360)
+
+
+def _closest_angle(angle: NDArray[np.float64]) -> NDArray[np.float64]:
+    return np.where(
+        np.abs(angle) <= 180,  # noqa: PLR2004
+        angle,
+        angle - (360 * np.round(angle / 360)),
+    )
+
+
+def _interpolate(
+    y2: NDArray[np.float64],
+    y1: NDArray[np.float64],
+    y3: NDArray[np.float64],
+    n: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    a = y2 - y1
+    b = y3 - y2
+    c = b - a
+    return y2 + ((n / 2) * (a + b + (n * c)))
+
+
+def _interpolate_angles(
+    y2: NDArray[np.float64],
+    y1: NDArray[np.float64],
+    y3: NDArray[np.float64],
+    n: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    a = _unwind_angle(y2 - y1)
+    b = _unwind_angle(y3 - y2)
+    c = b - a
+    return y2 + ((n / 2) * (a + b + (n * c)))
+
+
+def solar_coordinates(julian_day: NDArray[np.float64]) -> SolarCoordinates:
+    """Compute solar coordinates, from Astronomical Algorithms page 163-165."""
+    t = (julian_day - 2451545.0) / 36525
+    t2 = t**2
+    t3 = t**3
+
+    l0 = _unwind_angle(280.4664567 + (36000.76983 * t) + (0.0003032 * t2))
+    lp = _unwind_angle(218.3165 + (481267.8813 * t))
+    omega = _unwind_angle(
+        125.04452 - (1934.136261 * t) + (0.0020708 * t2) + t3 / 450000
+    )
+    m = _unwind_angle(357.52911 + (35999.05029 * t) - (0.0001537 * t2))
+
+    m_rad = np.radians(m)
+    center = (
+        ((1.914602 - (0.004817 * t) - (0.000014 * t2)) * np.sin(m_rad))
+        + ((0.019993 - (0.000101 * t)) * np.sin(2 * m_rad))
+        + (0.000289 * np.sin(3 * m_rad))
+    )
+    o = 125.04 - (1934.136 * t)
+    apparent_longitude = np.radians(
+        _unwind_angle(l0 + center - 0.00569 - (0.00478 * np.sin(np.radians(o))))
+    )
+
+    jd = (t * 36525) + 2451545.0
+    mean_sidereal_time = _unwind_angle(
+        280.46061837
+        + (360.98564736629 * (jd - 2451545))
+        + (0.000387933 * t2)
+        - (t3 / 38710000)
+    )
+
+    omega_rad = np.radians(omega)
+    l0_rad = np.radians(l0)
+    lp_rad = np.radians(lp)
+    nutation_longitude = (
+        ((-17.2 / 3600) * np.sin(omega_rad))
+        - ((1.32 / 3600) * np.sin(2 * l0_rad))
+        - ((0.23 / 3600) * np.sin(2 * lp_rad))
+        + ((0.21 / 3600) * np.sin(2 * omega_rad))
+    )
+    nutation_obliquity = (
+        ((9.2 / 3600) * np.cos(omega_rad))
+        + ((0.57 / 3600) * np.cos(2 * l0_rad))
+        + ((0.10 / 3600) * np.cos(2 * lp_rad))
+        - ((0.09 / 3600) * np.cos(2 * omega_rad))
+    )
+
+    mean_obliquity = (
+        23.439291 - (0.013004167 * t) - (0.0000001639 * t2) + (0.0000005036 * t3)
+    )
+    apparent_obliquity = np.radians(mean_obliquity + (0.00256 * np.cos(np.radians(o))))
+
+    return SolarCoordinates(
+        declination=np.degrees(
+            np.arcsin(np.sin(apparent_obliquity) * np.sin(apparent_longitude))
+        ),
+        right_ascension=_unwind_angle(
+            np.degrees(
+                np.arctan2(
+                    np.cos(apparent_obliquity) * np.sin(apparent_longitude),
+                    np.cos(apparent_longitude),
+                )
+            )
+        ),
+        apparent_sidereal_time=mean_sidereal_time
+        + (
+            (
+                (nutation_longitude * 3600)
+                * np.cos(np.radians(mean_obliquity + nutation_obliquity))
+            )
+            / 3600
+        ),
+    )
+
+
+class _SolarTime:
+    """Solar time of a day at a location, see `adhanpy.astronomy.SolarTime`."""
+
+    def __init__(
+        self,
+        latitude: NDArray[np.float64],
+        longitude: NDArray[np.float64],
+        solar_days: tuple[SolarCoordinates, SolarCoordinates, SolarCoordinates],
+    ) -> None:
+        """Initialize from the solar coordinates of the previous, same and next day."""
+        prev_solar, solar, next_solar = solar_days
+        self.latitude = latitude
+        self.longitude = longitude
+        self.prev_solar = prev_solar
+        self.solar = solar
+        self.next_solar = next_solar
+
+        self.approximate_transit = _normalize_with_bound(
+            (solar.right_ascension + (longitude * -1) - solar.apparent_sidereal_time)
+            / 360,
+            1,
+        )
+
+        theta = _unwind_angle(
+            solar.apparent_sidereal_time + (360.985647 * self.approximate_transit)
+        )
+        alpha = _unwind_angle(
+            _interpolate_angles(
+                solar.right_ascension,
+                prev_solar.right_ascension,
+                next_solar.right_ascension,
+                self.approximate_transit,
+            )
+        )
+        hour_angle = _closest_angle(theta - (longitude * -1) - alpha)
+        self.transit = (self.approximate_transit + (hour_angle / -360)) * 24
+
+        self.sunrise = self.hour_angle(SOLAR_ALTITUDE, after_transit=False)
+        self.sunset = self.hour_angle(SOLAR_ALTITUDE, after_transit=True)
+
+    def hour_angle(
+        self, angle: float | NDArray[np.float64], *, after_transit: bool
+    ) -> NDArray[np.float64]:
+        """Hours from midnight at which the sun reaches `angle`."""
+        solar = self.solar
+        latitude_rad = np.radians(self.latitude)
+        term1 = np.sin(np.radians(angle)) - (
+            np.sin(latitude_rad) * np.sin(np.radians(solar.declination))
+        )
+        term2 = np.cos(latitude_rad) * np.cos(np.radians(solar.declination))
+        h0 = np.degrees(np.arccos(term1 / term2))
+        m = (
+            self.approximate_transit + (h0 / 360)
+            if after_transit
+            else self.approximate_transit - (h0 / 360)
+        )
+        theta = _unwind_angle(solar.apparent_sidereal_time + (360.985647 * m))
+        alpha = _unwind_angle(
+            _interpolate_angles(
+                solar.right_ascension,
+                self.prev_solar.right_ascension,
+                self.next_solar.right_ascension,
+                m,
+            )
+        )
+        delta = _interpolate(
+            solar.declination,
+            self.prev_solar.declination,
+            self.next_solar.declination,
+            m,
+        )
+        hour_angle = theta - (self.longitude * -1) - alpha
+
+        delta_rad = np.radians(delta)
+        altitude = np.degrees(
+            np.arcsin(
+                (np.sin(latitude_rad) * np.sin(delta_rad))
+                + (
+                    np.cos(latitude_rad)
+                    * np.cos(delta_rad)
+                    * np.cos(np.radians(hour_angle))
+                )
+            )
+        )
+        term3 = altitude - angle
+        term4 = (
+            360
+            * np.cos(delta_rad)
+            * np.cos(latitude_rad)
+            * np.sin(np.radians(hour_angle))
+        )
+        delta_m = np.where(term4 == 0, np.nan, term3 / np.where(term4 == 0, 1, term4))
+        return (m + delta_m) * 24
+
+    def afternoon(self, shadow_length: float) -> NDArray[np.float64]:
+        """Hours from midnight of asr for a shadow length."""
+        tangent = np.abs(self.latitude - self.solar.declination)
+        inverse = shadow_length + np.tan(np.radians(tangent))
+        angle = np.degrees(np.arctan(1.0 / inverse))
+        return self.hour_angle(angle, after_transit=True)
+
+
+def _to_seconds(
+    midnight: NDArray[np.float64], hours: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Time of day in hours to epoch seconds, truncated to the second."""
+    return midnight + np.floor(hours * 60 * 60)
+
+
+def _rounded_minute(when: NDArray[np.float64], adjustment: int) -> NDArray[np.float64]:
+    """Add an offset in minutes and round to the minute like AdhanPy does."""
+    when = when + (adjustment * 60)
+    second = np.mod(when, 60)
+    minute = np.mod(np.floor(when / 60), 60)
+    # `round(30 / 60)` rounds half to even, and minute 59 is never rounded up
+    return when - second + np.where((second > 30) & (minute != 59), 60, 0)  # noqa: PLR2004
+
+
+def compute_prayer_times(
+    latitude: ArrayLike,
+    longitude: ArrayLike,
+    day: ArrayLike,
+    parameters: SolarParameters,
+) -> SolarPrayerTimes:
+    """
+    Compute prayer times for days given as `date.toordinal()`.
+
+    `latitude`, `longitude` and `day` are broadcast against each other.
+    """
+    latitude = np.asarray(latitude, dtype=np.float64)
+    longitude = np.asarray(longitude, dtype=np.float64)
+    day = np.asarray(day, dtype=np.int64)
+
+    julian_day = day + JULIAN_DAY_ORDINAL_OFFSET
+    midnight = ((day - EPOCH_ORDINAL) * SECONDS_PER_DAY).astype(np.float64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        prev_solar = solar_coordinates(julian_day - 1)
+        solar = solar_coordinates(julian_day)
+        next_solar = solar_coordinates(julian_day + 1)
+        after_next_solar = solar_coordinates(julian_day + 2)
+
+        solar_time = _SolarTime(latitude, longitude, (prev_solar, solar, next_solar))
+        tomorrow_solar_time = _SolarTime(
+            latitude, longitude, (solar, next_solar, after_next_solar)
+        )
+
+        sunrise = _to_seconds(midnight, solar_time.sunrise)
+        sunset = _to_seconds(midnight, solar_time.sunset)
+        tomorrow_sunrise = _to_seconds(
+            midnight + SECONDS_PER_DAY, tomorrow_solar_time.sunrise
+        )
+        night_length = tomorrow_sunrise * 1000 - sunset * 1000
+
+        fajr = _to_seconds(
+            midnight,
+            solar_time.hour_angle(-parameters.fajr_angle, after_transit=False),
+        )
+        safe_fajr = sunrise - np.trunc(parameters.fajr_portion * night_length / 1000)
+        fajr = np.where(np.isnan(fajr) | (fajr < safe_fajr), safe_fajr, fajr)
+
+        if parameters.isha_interval >= 1:
+            isha = sunset + (parameters.isha_interval * 60)
+        else:
+            isha = _to_seconds(
+                midnight,
+                solar_time.hour_angle(-parameters.isha_angle, after_transit=True),
+            )
+            safe_isha = sunset + np.trunc(parameters.isha_portion * night_length / 1000)
+            isha = np.where(np.isnan(isha) | (isha > safe_isha), safe_isha, isha)
+
+        dhuhr = _to_seconds(midnight, solar_time.transit)
+        asr = _to_seconds(midnight, solar_time.afternoon(parameters.shadow_length))
+
+    # AdhanPy gives up on the whole day when any of these is undefined
+    undefined = (
+        np.isnan(sunrise) | np.isnan(night_length) | np.isnan(dhuhr) | np.isnan(asr)
+    )
+    fajr, sunrise, dhuhr, asr, sunset, isha, night_length = (
+        np.where(undefined, np.nan, when)
+        for when in (fajr, sunrise, dhuhr, asr, sunset, isha, night_length)
+    )
+
+    fajr_adj, sunrise_adj, dhuhr_adj, asr_adj, maghrib_adj, isha_adj = (
+        parameters.adjustments
+    )
+
+    return SolarPrayerTimes(
+        fajr=_rounded_minute(fajr, fajr_adj),
+        sunrise=_rounded_minute(sunrise, sunrise_adj),
+        dhuhr=_rounded_minute(dhuhr, dhuhr_adj),
+        asr=_rounded_minute(asr, asr_adj),
+        maghrib=_rounded_minute(sunset, maghrib_adj),
+        isha=_rounded_minute(isha, isha_adj),
+        night_length=night_length,
+    )
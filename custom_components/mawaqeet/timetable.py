@@ -0,0 +1,226 @@
+"""Rolling prayer-time table for mawaqeet."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from math import isnan
+from typing import TYPE_CHECKING, NamedTuple, TypedDict
+
+from .const import DEFAULT_WINDOW_DAYS
+from .enum import PrayerTime
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+# fajr, sunrise, dhuhr, asr, maghrib, isha (epoch seconds) and night length (ms)
+ROW_SIZE = 7
+
+# Prayer of each code of the prayer time index
+PRAYER_CODES = tuple(PrayerTime)
+
+
+class DayRow(NamedTuple):
+    """Prayer times of a single day."""
+
+    fajr: datetime
+    sunrise: datetime
+    dhuhr: datetime
+    asr: datetime
+    maghrib: datetime
+    isha: datetime
+    night_length: float
+
+
+def to_day_row(values: Sequence[float]) -> DayRow | None:
+    """Return the prayer times of `ROW_SIZE` values, None if any is undefined."""
+    if any(isnan(value) for value in values):
+        return None
+
+    return DayRow(
+        *(datetime.fromtimestamp(value, UTC) for value in values[:-1]),
+        night_length=values[-1],
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class DayTimes:
+    """Prayer times of a day, along with the night times that follow it."""
+
+    day: date
+    fajr: datetime
+    shuruq: datetime
+    dhuhr: datetime
+    asr: datetime
+    maghrib: datetime
+    ishaa: datetime
+    midnight: datetime
+    last_third: datetime
+
+    def __getitem__(self, prayer: PrayerTime) -> datetime:
+        """Return the time of a prayer."""
+        return getattr(self, prayer)
+
+    def items(self) -> Iterator[tuple[PrayerTime, datetime]]:
+        """Generate every prayer time in the order of the day."""
+        return ((prayer, getattr(self, prayer)) for prayer in PrayerTime)
+
+
+class PrayerTimeIndex:
+    """
+    Sorted prayer times of consecutive days.
+
+    Times are kept as epoch seconds in an array of doubles, along with a
+    parallel array of prayer codes, so that finding the current or next
+    prayer is a binary search rather than comparisons of datetimes.
+    """
+
+    __slots__ = ("_codes", "_times")
+
+    def __init__(self, days: Iterable[DayTimes] = ()) -> None:
+        """Index the prayer times of `days`."""
+        entries = sorted(
+            (prayer_dt.timestamp(), code)
+            for day_times in days
+            for code, (_, prayer_dt) in enumerate(day_times.items())
+        )
+        self._times = array("d", [timestamp for timestamp, _ in entries])
+        self._codes = array("B", [code for _, code in entries])
+
+    def __len__(self) -> int:
+        """Return the number of indexed prayer times."""
+        return len(self._times)
+
+    def __entry(self, index: int) -> tuple[PrayerTime, datetime]:
+        return (
+            PRAYER_CODES[self._codes[index]],
+            datetime.fromtimestamp(self._times[index], UTC),
+        )
+
+    def current(self, now: datetime) -> tuple[PrayerTime, datetime] | None:
+        """Return the last prayer time at or before `now`, if any is indexed."""
+        if (index := bisect_right(self._times, now.timestamp())) == 0:
+            return None
+        return self.__entry(index - 1)
+
+    def next(self, now: datetime) -> tuple[PrayerTime, datetime] | None:
+        """Return the first prayer time after `now`, if any is indexed."""
+        if (index := bisect_right(self._times, now.timestamp())) == len(self._times):
+            return None
+        return self.__entry(index)
+
+
+class StoredTable(TypedDict):
+    """Prayer time table as stored on disk."""
+
+    start: int
+    rows: list[float | None]
+
+
+class PrayerTimeTable:
+    """
+    Window of consecutive days of prayer times.
+
+    Rows are kept flat in an array of doubles, `ROW_SIZE` values per day.
+    Advancing the window drops past days and only computes the days that
+    become exposed at its end.
+    """
+
+    def __init__(self, days: int = DEFAULT_WINDOW_DAYS) -> None:
+        """Initialize an empty table of `days` days."""
+        self._days = max(days, 2)
+        self._start: int | None = None
+        self._rows = array("d")
+
+    def __len__(self) -> int:
+        """Return the number of days in the table."""
+        return len(self._rows) // ROW_SIZE
+
+    def __contains__(self, day: object) -> bool:
+        """Return if the day is covered by the table."""
+        if not isinstance(day, date) or self._start is None:
+            return False
+        return 0 <= day.toordinal() - self._start < len(self)
+
+    @property
+    def days(self) -> int:
+        """Return the size of the window in days."""
+        return self._days
+
+    def clear(self) -> None:
+        """Drop every computed day."""
+        self._start = None
+        del self._rows[:]
+
+    def missing_days(self, today: date) -> int:
+        """Return the number of days `advance` would compute for `today`."""
+        if today not in self:
+            return self._days
+        return self._days - len(self) + (today.toordinal() - (self._start or 0))
+
+    def advance(
+        self,
+        today: date,
+        compute: Callable[[date, int], Sequence[float]],
+    ) -> int:
+        """
+        Move the window to start at `today`.
+
+        `compute` is called once with the first day missing from the table
+        and the number of missing days, and must return `ROW_SIZE` values
+        per day. Returns the number of computed days.
+        """
+        first = today.toordinal()
+
+        if self._start is None or today not in self:
+            self.clear()
+        else:
+            del self._rows[: (first - self._start) * ROW_SIZE]
+        self._start = first
+
+        missing = self._days - len(self)
+        if missing > 0:
+            self._rows.extend(
+                compute(date.fromordinal(first + len(self)), missing),
+            )
+
+        return max(missing, 0)
+
+    def row(self, day: date) -> DayRow:
+        """Return prayer times of a day in the table."""
+        if day not in self:
+            msg = f"{day} is not in the prayer time table"
+            raise KeyError(msg)
+
+        offset = (day.toordinal() - (self._start or 0)) * ROW_SIZE
+        if (row := to_day_row(self._rows[offset : offset + ROW_SIZE])) is None:
+            msg = f"Prayer times of {day} are undefined at this location"
+            raise ValueError(msg)
+
+        return row
+
+    def iter_rows(self) -> Iterator[tuple[date, DayRow | None]]:
+        """Generate the prayer times of every day, None when undefined."""
+        start = self._start or 0
+        for offset in range(0, len(self._rows), ROW_SIZE):
+            yield (
+                date.fromordinal(start + offset // ROW_SIZE),
+                to_day_row(self._rows[offset : offset + ROW_SIZE]),
+            )
+
+    def as_dict(self) -> StoredTable:
+        """Return the table in a JSON serializable form."""
+        return {
+            "start": self._start or 0,
+            # NaN is not valid JSON
+            "rows": [None if isnan(value) else value for value in self._rows],
+        }
+
+    def load(self, start: int, rows: Iterable[float | None]) -> None:
+        """Replace the table with stored rows starting at day ordinal `start`."""
+        self.clear()
+        self._rows.extend(float("nan") if value is None else value for value in rows)
+        del self._rows[len(self._rows) - len(self._rows) % ROW_SIZE :]
+        self._start = start